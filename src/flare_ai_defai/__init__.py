@@ -1,6 +1,6 @@
 from flare_ai_defai.ai import GeminiProvider
 from flare_ai_defai.api import ChatRouter, router
-from flare_ai_defai.attestation import Vtpm
+from flare_ai_defai.attestation import AsyncBatchingVtpm, Vtpm
 from flare_ai_defai.blockchain import FlareProvider
 from flare_ai_defai.prompts import (
     PromptService,
@@ -8,6 +8,7 @@ from flare_ai_defai.prompts import (
 )
 
 __all__ = [
+    "AsyncBatchingVtpm",
     "ChatRouter",
     "FlareProvider",
     "GeminiProvider",
@@ -1,20 +1,28 @@
 from .base import (
     BaseAIProvider,
+    CacheControl,
     ChatRequest,
     CompletionRequest,
     GenerationConfig,
+    Message,
     ModelResponse,
+    TextContent,
 )
+from .cache import LLMCache
 from .gemini import GeminiProvider
 from .openrouter import AsyncOpenRouterProvider, OpenRouterProvider
 
 __all__ = [
     "AsyncOpenRouterProvider",
     "BaseAIProvider",
+    "CacheControl",
     "ChatRequest",
     "CompletionRequest",
     "GeminiProvider",
     "GenerationConfig",
+    "LLMCache",
+    "Message",
     "ModelResponse",
     "OpenRouterProvider",
+    "TextContent",
 ]
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from typing import Any, Literal, Protocol, TypedDict, runtime_checkable
+from typing import Any, Literal, NotRequired, Protocol, TypedDict, runtime_checkable
 
 import httpx
 import requests
@@ -44,7 +45,7 @@ class BaseAIProvider(ABC):
         """Reset the conversation history"""
 
     @abstractmethod
-    def generate(
+    async def generate(
         self,
         prompt: str,
         response_mime_type: str | None = None,
@@ -62,8 +63,22 @@ class BaseAIProvider(ABC):
             ModelResponse containing the generated text and metadata
         """
 
+    async def cached_generate(self, prompt: str) -> ModelResponse:
+        """Generate a response for a fixed prompt, reusing earlier responses
+
+        Intended for prompts without variable inputs. Providers that do not cache
+        simply call generate.
+
+        Args:
+            prompt: Input text prompt
+
+        Returns:
+            ModelResponse containing the generated text and metadata
+        """
+        return await self.generate(prompt)
+
     @abstractmethod
-    def send_message(self, msg: str) -> ModelResponse:
+    async def send_message(self, msg: str) -> ModelResponse:
         """Send a message in a conversational context
 
         Args:
@@ -73,15 +88,40 @@ class BaseAIProvider(ABC):
             ModelResponse containing the response text and metadata
         """
 
+    @abstractmethod
+    def stream(self, msg: str) -> AsyncIterator[str]:
+        """Send a message in a conversational context and stream the response
+
+        Args:
+            msg: Input message text
+
+        Returns:
+            Async iterator over the response text as it is generated
+        """
+
 
 class CompletionRequest(TypedDict):
     model: str
     prompt: str
 
 
+class CacheControl(TypedDict):
+    """Prompt caching marker understood by OpenRouter and Anthropic"""
+
+    type: Literal["ephemeral"]
+
+
+class TextContent(TypedDict):
+    """Text part of a message; cache_control marks a prefix the provider may cache"""
+
+    type: Literal["text"]
+    text: str
+    cache_control: NotRequired[CacheControl]
+
+
 class Message(TypedDict):
     role: Literal["user", "assistant", "system"]
-    content: str
+    content: str | list[TextContent]
 
 
 class ChatRequest(TypedDict):
@@ -0,0 +1,113 @@
+"""
+LLM Response Cache Module
+
+This module provides a small in-memory cache for model responses. It is used to
+short-circuit repeated deterministic calls, such as semantic routing or structured
+parameter extraction, which would otherwise pay a full LLM round-trip for an answer
+that has already been computed.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from flare_ai_defai.ai.base import ModelResponse
+
+
+class LLMCache:
+    """
+    Async-safe LRU cache with a per-entry time-to-live for model responses.
+
+    Entries are evicted in least-recently-used order once maxsize is exceeded, and
+    are treated as missing once their TTL has elapsed.
+
+    Attributes:
+        maxsize (int): Maximum number of cached responses
+        ttl (float): Number of seconds a cached response stays valid
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of cached responses
+            ttl (float): Number of seconds a cached response stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, ModelResponse]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        response_mime_type: str | None,
+        response_schema: Any | None,
+    ) -> str:
+        """
+        Build a stable cache key for a generation request.
+
+        Args:
+            model (str): Model identifier
+            prompt (str): Input prompt
+            response_mime_type (str | None): Expected MIME type for the response
+            response_schema (Any | None): Schema defining the response structure
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = orjson.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "mime": response_mime_type,
+                "schema": repr(response_schema),
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def get(self, key: str) -> ModelResponse | None:
+        """
+        Return the cached response for a key, if present and not expired.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            ModelResponse | None: Cached response, or None on a miss
+        """
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        """
+        Store a response, evicting the least recently used entries if needed.
+
+        Args:
+            key (str): Cache key from make_key
+            response (ModelResponse): Response to cache
+        """
+        async with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
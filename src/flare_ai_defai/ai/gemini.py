@@ -6,6 +6,12 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any, override
 
 import google.generativeai as genai
@@ -13,9 +19,11 @@ import structlog
 from google.generativeai.types import ContentDict
 
 from flare_ai_defai.ai.base import BaseAIProvider, ModelResponse
+from flare_ai_defai.ai.cache import LLMCache
 
 logger = structlog.get_logger(__name__)
 
+_STATIC_RESPONSE_CACHE_SIZE = 64
 
 SYSTEM_INSTRUCTION = """
 You are Artemis, an AI assistant specialized in helping users navigate
@@ -48,18 +56,63 @@ more engaging - your goal is to be helpful first, entertaining second.
 """
 
 
+# Shared models keyed by (model, system_instruction). The genai client is
+# configured process-wide, so there is one API key per process and it is not
+# part of the key.
+_MODEL_CACHE: dict[tuple[str, str], genai.GenerativeModel] = {}  # pyright: ignore [reportPrivateImportUsage]
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _configure(api_key: str) -> None:
+    """
+    Configure the process-global genai client for the given API key.
+
+    genai.configure() discards the cached service clients, so it only runs when the
+    key changes. This keeps a single grpc_asyncio channel alive for the lifetime of
+    the process, and concurrent requests are multiplexed over its HTTP/2 connection
+    instead of paying a new TCP+TLS handshake. Models built before a key change may
+    hold clients for the old key, so they are dropped from the shared cache.
+    """
+    genai.configure(api_key=api_key, transport="grpc_asyncio")  # pyright: ignore [reportPrivateImportUsage]
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+
+def _get_model(model: str, system_instruction: str) -> genai.GenerativeModel:  # pyright: ignore [reportPrivateImportUsage]
+    """
+    Return the shared GenerativeModel for a configuration, building it on first use.
+
+    The model caches its async client, so sharing one instance per configuration
+    means every provider reuses the same channel instead of creating its own.
+    """
+    key = (model, system_instruction)
+    with _MODEL_CACHE_LOCK:
+        generative_model = _MODEL_CACHE.get(key)
+        if generative_model is None:
+            generative_model = genai.GenerativeModel(  # pyright: ignore [reportPrivateImportUsage]
+                model_name=model, system_instruction=system_instruction
+            )
+            _MODEL_CACHE[key] = generative_model
+        return generative_model
+
+
 class GeminiProvider(BaseAIProvider):
     """
     Provider class for Google's Gemini AI service.
 
     This class implements the BaseAIProvider interface to provide AI capabilities
     through Google's Gemini models. It manages chat sessions, generates content,
-    and maintains conversation history.
+    and maintains conversation history. The genai client is configured per
+    process, so all providers in a process must share one API key.
 
     Attributes:
         chat (genai.ChatSession | None): Active chat session
         model (genai.GenerativeModel): Configured Gemini model instance
         chat_history (list[ContentDict]): History of chat interactions
+        cache (LLMCache): Cache for structured (schema-constrained) responses
+        static_responses (OrderedDict[bytes, ModelResponse]): Responses to fixed
+            prompts, keyed by a short prompt digest
         logger (BoundLogger): Structured logger for the provider
     """
 
@@ -73,15 +126,18 @@ class GeminiProvider(BaseAIProvider):
             **kwargs (str): Additional configuration parameters including:
                 - system_instruction: Custom system prompt for the AI personality
         """
-        genai.configure(api_key=api_key)  # pyright: ignore [reportPrivateImportUsage]
+        _configure(api_key)
         self.chat: genai.ChatSession | None = None  # pyright: ignore [reportPrivateImportUsage]
-        self.model = genai.GenerativeModel(  # pyright: ignore [reportPrivateImportUsage]
-            model_name=model,
-            system_instruction=kwargs.get("system_instruction", SYSTEM_INSTRUCTION),
+        self.model = _get_model(
+            model, kwargs.get("system_instruction", SYSTEM_INSTRUCTION)
         )
         self.chat_history: list[ContentDict] = [
             ContentDict(parts=["Hi, I'm Artemis"], role="model")
         ]
+        self.cache = LLMCache()
+        # Chat turns read and extend the shared history, so they run one at a time
+        self._chat_lock = asyncio.Lock()
+        self.static_responses: OrderedDict[bytes, ModelResponse] = OrderedDict()
         self.logger = logger.bind(service="gemini")
 
     @override
@@ -98,7 +154,7 @@ class GeminiProvider(BaseAIProvider):
         )
 
     @override
-    def generate(
+    async def generate(
         self,
         prompt: str,
         response_mime_type: str | None = None,
@@ -107,6 +163,10 @@ class GeminiProvider(BaseAIProvider):
         """
         Generate content using the Gemini model.
 
+        Calls with a response_schema are deterministic classification or extraction
+        requests, so their responses are served from the cache when an identical
+        request has already been answered.
+
         Args:
             prompt (str): Input prompt for content generation
             response_mime_type (str | None): Expected MIME type for the response
@@ -120,14 +180,24 @@ class GeminiProvider(BaseAIProvider):
                     - candidate_count: Number of generated candidates
                     - prompt_feedback: Feedback on the input prompt
         """
-        response = self.model.generate_content(
+        cache_key = None
+        if response_schema is not None:
+            cache_key = LLMCache.make_key(
+                self.model.model_name, prompt, response_mime_type, response_schema
+            )
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("generate_cache_hit", prompt=prompt)
+                return cached
+
+        response = await self.model.generate_content_async(
             prompt,
             generation_config=genai.GenerationConfig(  # pyright: ignore [reportPrivateImportUsage]
                 response_mime_type=response_mime_type, response_schema=response_schema
             ),
         )
         self.logger.debug("generate", prompt=prompt, response_text=response.text)
-        return ModelResponse(
+        model_response = ModelResponse(
             text=response.text,
             raw_response=response,
             metadata={
@@ -135,9 +205,39 @@ class GeminiProvider(BaseAIProvider):
                 "prompt_feedback": response.prompt_feedback,
             },
         )
+        if cache_key is not None:
+            await self.cache.set(cache_key, model_response)
+        return model_response
+
+    @override
+    async def cached_generate(self, prompt: str) -> ModelResponse:
+        """
+        Generate content for a fixed prompt, serving repeats from memory.
+
+        Fixed prompts such as follow-ups carry no user input, so a single response
+        can be reused instead of paying a round-trip on every call.
+
+        Args:
+            prompt (str): Input prompt without variable inputs
+
+        Returns:
+            ModelResponse: Generated or previously cached response
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=8).digest()
+        cached = self.static_responses.get(key)
+        if cached is not None:
+            self.static_responses.move_to_end(key)
+            self.logger.debug("cached_generate_hit", prompt=prompt)
+            return cached
+
+        response = await self.generate(prompt)
+        self.static_responses[key] = response
+        if len(self.static_responses) > _STATIC_RESPONSE_CACHE_SIZE:
+            self.static_responses.popitem(last=False)
+        return response
 
     @override
-    def send_message(
+    async def send_message(
         self,
         msg: str,
     ) -> ModelResponse:
@@ -145,6 +245,7 @@ class GeminiProvider(BaseAIProvider):
         Send a message in a chat session and get the response.
 
         Initializes a new chat session if none exists, using the current chat history.
+        Concurrent turns are serialized so each one builds on the previous reply.
 
         Args:
             msg (str): Message to send to the chat session
@@ -157,9 +258,10 @@ class GeminiProvider(BaseAIProvider):
                     - candidate_count: Number of generated candidates
                     - prompt_feedback: Feedback on the input message
         """
-        if not self.chat:
-            self.chat = self.model.start_chat(history=self.chat_history)
-        response = self.chat.send_message(msg)
+        async with self._chat_lock:
+            if not self.chat:
+                self.chat = self.model.start_chat(history=self.chat_history)
+            response = await self.chat.send_message_async(msg)
         self.logger.debug("send_message", msg=msg, response_text=response.text)
         return ModelResponse(
             text=response.text,
@@ -169,3 +271,33 @@ class GeminiProvider(BaseAIProvider):
                 "prompt_feedback": response.prompt_feedback,
             },
         )
+
+    @override
+    async def stream(self, msg: str) -> AsyncIterator[str]:
+        """
+        Send a message in a chat session and stream the response as it is generated.
+
+        Shares the chat history with send_message. The turn is only appended to the
+        history once the stream has completed, so a stream that is abandoned by the
+        client or fails partway leaves the session usable and unchanged. Other chat
+        turns wait until the stream has finished.
+
+        Args:
+            msg (str): Message to send to the chat session
+
+        Yields:
+            str: Text of each response chunk
+        """
+        async with self._chat_lock:
+            if not self.chat:
+                self.chat = self.model.start_chat(history=self.chat_history)
+            chat = self.chat
+            history = [*chat.history, ContentDict(parts=[msg], role="user")]
+            response = await self.model.generate_content_async(history, stream=True)
+            chunks: list[str] = []
+            async for chunk in response:
+                chunks.append(chunk.text)
+                yield chunk.text
+            response_text = "".join(chunks)
+            chat.history = [*history, ContentDict(parts=[response_text], role="model")]
+        self.logger.debug("stream", msg=msg, response_text=response_text)
@@ -11,23 +11,113 @@ The module provides a ChatRouter class that integrates various services:
 - Prompt management through PromptService
 """
 
-import json
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Final
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from web3 import Web3
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from web3.exceptions import Web3RPCError
 
 from flare_ai_defai.ai import GeminiProvider
 from flare_ai_defai.attestation import Vtpm, VtpmAttestationError
 from flare_ai_defai.blockchain import FlareProvider
-from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
+from flare_ai_defai.prompts import (
+    PromptService,
+    SemanticRouterResponse,
+    TokenSendPayload,
+)
 from flare_ai_defai.settings import settings
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+_WEI_PER_FLR: Final = 10**18
+_ROUTE_BY_VALUE: Final = {
+    route.value.casefold(): route for route in SemanticRouterResponse
+}
+_ROUTE_CACHE_SIZE: Final = 256
+# Validates send parameters parsed from model output before they are used
+_SEND_PAYLOAD: Final = TypeAdapter(TokenSendPayload)
+
+
+def _parse_route(value: str) -> SemanticRouterResponse:
+    """
+    Map a routing response value to its SemanticRouterResponse member.
+
+    Case and surrounding whitespace are ignored, as the model does not always
+    reproduce the route name exactly.
+
+    Args:
+        value: Route value returned by the AI provider
+
+    Returns:
+        SemanticRouterResponse: Matching route
+
+    Raises:
+        ValueError: If the value is not a known route
+    """
+    route = _ROUTE_BY_VALUE.get(value.strip().casefold())
+    if route is None:
+        msg = f"'{value}' is not a valid SemanticRouterResponse"
+        raise ValueError(msg)
+    return route
+
+
+def _format_flr(value_wei: int) -> str:
+    """
+    Format a wei amount as FLR exactly, without rounding through a float.
+
+    Args:
+        value_wei: Amount in wei
+
+    Returns:
+        str: Amount in FLR, without trailing zeros or a trailing decimal point
+    """
+    whole, frac = divmod(value_wei, _WEI_PER_FLR)
+    return f"{whole}.{frac:018d}".rstrip("0").rstrip(".")
+
+
+def _normalize_query(message: str) -> str:
+    """
+    Reduce a message to a key shared by trivial phrasing variants.
+
+    Case, runs of whitespace and trailing punctuation do not change how a message
+    is routed, so messages differing only in those share a routing decision.
+
+    Args:
+        message: Message to normalize
+
+    Returns:
+        str: Normalized message
+    """
+    # Strip punctuation before collapsing whitespace, so "hi ?" also becomes "hi"
+    return " ".join(message.casefold().rstrip("?!. \t\n").split())
+
+
+def _sse_event(data: str, event: str | None = None) -> str:
+    """
+    Encode a Server-Sent Events frame.
+
+    Each line of data gets its own "data:" field so multi-line text survives
+    transport intact.
+
+    Args:
+        data: Event payload
+        event: Optional event type
+
+    Returns:
+        str: Encoded frame, terminated by a blank line
+    """
+    lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+    if event is None:
+        return f"{lines}\n"
+    return f"event: {event}\n{lines}\n"
+
 
 class ChatMessage(BaseModel):
     """
@@ -37,6 +127,8 @@ class ChatMessage(BaseModel):
         message (str): The chat message content, must not be empty
     """
 
+    model_config = ConfigDict(strict=True)
+
     message: str = Field(..., min_length=1)
 
 
@@ -78,11 +170,24 @@ class ChatRouter:
         self.attestation = attestation
         self.prompts = prompts
         self.logger = logger.bind(router="chat")
+        self._route_cache: OrderedDict[
+            str, tuple[SemanticRouterResponse, TokenSendPayload]
+        ] = OrderedDict()
+        # Bound once here rather than on every routed message
+        self._handlers: dict[
+            SemanticRouterResponse, Callable[[str], Awaitable[dict[str, str]]]
+        ] = {
+            SemanticRouterResponse.GENERATE_ACCOUNT: self.handle_generate_account,
+            SemanticRouterResponse.SEND_TOKEN: self.handle_send_token,
+            SemanticRouterResponse.SWAP_TOKEN: self.handle_swap_token,
+            SemanticRouterResponse.REQUEST_ATTESTATION: self.handle_attestation,
+            SemanticRouterResponse.CONVERSATIONAL: self.handle_conversation,
+        }
         self._setup_routes()
 
     def _setup_routes(self) -> None:
         """
-        Set up FastAPI routes for the chat endpoint.
+        Set up FastAPI routes for the chat and streaming chat endpoints.
         Handles message routing, command processing, and transaction confirmations.
         """
 
@@ -101,54 +206,121 @@ class ChatRouter:
                 HTTPException: If message handling fails
             """
             try:
-                self.logger.debug("received_message", message=message.message)
-
-                if message.message.startswith("/"):
-                    return await self.handle_command(message.message)
-                if (
-                    self.blockchain.tx_queue
-                    and message.message == self.blockchain.tx_queue[-1].msg
-                ):
-                    try:
-                        tx_hash = self.blockchain.send_tx_in_queue()
-                    except Web3RPCError as e:
-                        self.logger.exception("send_tx_failed", error=str(e))
-                        msg = (
-                            f"Unfortunately the tx failed with the error:\n{e.args[0]}"
-                        )
-                        return {"response": msg}
-
-                    prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                        "tx_confirmation",
-                        tx_hash=tx_hash,
-                        block_explorer=settings.web3_explorer_url,
-                    )
-                    tx_confirmation_response = self.ai.generate(
-                        prompt=prompt,
-                        response_mime_type=mime_type,
-                        response_schema=schema,
-                    )
-                    return {"response": tx_confirmation_response.text}
-                if self.attestation.attestation_requested:
-                    try:
-                        resp = self.attestation.get_token([message.message])
-                    except VtpmAttestationError as e:
-                        resp = f"The attestation failed with  error:\n{e.args[0]}"
-                    self.attestation.attestation_requested = False
-                    return {"response": resp}
-
-                route = await self.get_semantic_route(message.message)
-                return await self.route_message(route, message.message)
+                msg_text = message.message
+                self.logger.debug("received_message", message=msg_text)
+
+                direct_response = await self.handle_direct_message(msg_text)
+                if direct_response is not None:
+                    return direct_response
+                route, payload = await self.resolve_route(msg_text)
+                return await self.route_message(route, msg_text, payload)
 
             except Exception as e:
                 self.logger.exception("message_handling_failed", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e)) from e
 
+        @self._router.post("/stream")
+        async def stream(message: ChatMessage) -> StreamingResponse:  # pyright: ignore [reportUnusedFunction]
+            """
+            Process incoming chat messages and stream the response as Server-Sent
+            Events.
+
+            Conversational replies are streamed chunk by chunk as the model generates
+            them; every other route is sent as a single event once it completes.
+
+            Args:
+                message: Validated chat message
+
+            Returns:
+                StreamingResponse: text/event-stream response carrying the reply
+            """
+            self.logger.debug("received_stream_message", message=message.message)
+            return StreamingResponse(
+                self.stream_message(message.message), media_type="text/event-stream"
+            )
+
     @property
     def router(self) -> APIRouter:
         """Get the FastAPI router with registered routes."""
         return self._router
 
+    async def handle_direct_message(self, message: str) -> dict[str, str] | None:
+        """
+        Handle messages that are answered without semantic routing.
+
+        These are commands, confirmations of the pending transaction and replies
+        to a pending attestation request. Commands and confirmations are checked
+        first, so "/reset" or a confirmation still works while an attestation
+        nonce is awaited.
+
+        Args:
+            message: Message to handle
+
+        Returns:
+            dict[str, str] | None: Response for the message, or None if it needs
+                semantic routing
+        """
+        if message.startswith("/"):
+            return await self.handle_command(message)
+        tx_queue = self.blockchain.tx_queue
+        if tx_queue and message == tx_queue[-1].msg:
+            try:
+                tx_hash = await self.blockchain.send_tx_in_queue()
+            except Web3RPCError as e:
+                self.logger.exception("send_tx_failed", error=str(e))
+                msg = f"Unfortunately the tx failed with the error:\n{e.args[0]}"
+                return {"response": msg}
+
+            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                "tx_confirmation",
+                tx_hash=tx_hash,
+                block_explorer=settings.web3_explorer_url,
+            )
+            tx_confirmation_response = await self.ai.generate(
+                prompt=prompt,
+                response_mime_type=mime_type,
+                response_schema=schema,
+            )
+            return {"response": tx_confirmation_response.text}
+        if self.attestation.attestation_requested:
+            try:
+                resp = await self.attestation.get_token([message])
+            except VtpmAttestationError as e:
+                resp = f"The attestation failed with  error:\n{e.args[0]}"
+            self.attestation.attestation_requested = False
+            return {"response": resp}
+        return None
+
+    async def stream_message(self, message: str) -> AsyncIterator[str]:
+        """
+        Handle a message and yield its response as Server-Sent Events.
+
+        Structured calls (routing, parameter extraction) still complete before any
+        output, as their full payload is needed to act. Only the conversational
+        reply is streamed from the AI provider.
+
+        Args:
+            message: Message to handle
+
+        Yields:
+            str: Encoded SSE frames; failures are reported as an "error" event
+        """
+        try:
+            direct_response = await self.handle_direct_message(message)
+            if direct_response is not None:
+                yield _sse_event(direct_response["response"])
+                return
+            route, payload = await self.resolve_route(message)
+            if route == SemanticRouterResponse.CONVERSATIONAL:
+                async for chunk in self.ai.stream(message):
+                    yield _sse_event(chunk)
+                return
+            response = await self.route_message(route, message, payload)
+            yield _sse_event(response["response"])
+        except Exception as e:
+            self.logger.exception("stream_handling_failed", error=str(e))
+            yield _sse_event(str(e), event="error")
+
     async def handle_command(self, command: str) -> dict[str, str]:
         """
         Handle special command messages starting with '/'.
@@ -179,16 +351,82 @@ class ChatRouter:
             prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                 "semantic_router", user_input=message
             )
-            route_response = self.ai.generate(
+            route_response = await self.ai.generate(
                 prompt=prompt, response_mime_type=mime_type, response_schema=schema
             )
-            return SemanticRouterResponse(route_response.text)
+            return _parse_route(route_response.text)
         except Exception as e:
             self.logger.exception("routing_failed", error=str(e))
             return SemanticRouterResponse.CONVERSATIONAL
 
+    async def get_combined_route(
+        self, message: str
+    ) -> tuple[SemanticRouterResponse, TokenSendPayload] | None:
+        """
+        Determine the semantic route and extract handler parameters in one AI call.
+
+        Fusing routing with parameter extraction saves the second round-trip that
+        handlers such as handle_send_token would otherwise make.
+
+        Args:
+            message: Message to route
+
+        Returns:
+            tuple[SemanticRouterResponse, TokenSendPayload] | None: Determined route
+                and its extracted payload, or None if the response fails validation
+                and the caller should fall back to get_semantic_route
+        """
+        try:
+            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                "combined_router_and_action", user_input=message
+            )
+            combined_response = await self.ai.generate(
+                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            )
+            combined_json = orjson.loads(combined_response.text)
+            route = _parse_route(combined_json["route"])
+            payload = _SEND_PAYLOAD.validate_python(combined_json.get("payload") or {})
+        except Exception as e:
+            self.logger.exception("combined_routing_failed", error=str(e))
+            return None
+        return route, payload
+
+    async def resolve_route(
+        self, message: str
+    ) -> tuple[SemanticRouterResponse, TokenSendPayload | None]:
+        """
+        Determine the route for a message, preferring the combined routing call.
+
+        Combined routing results are remembered per normalized message, so
+        repeated queries that differ only in case, spacing or trailing punctuation
+        skip the AI call.
+
+        Args:
+            message: Message to route
+
+        Returns:
+            tuple[SemanticRouterResponse, TokenSendPayload | None]: Route and the
+                parameters extracted alongside it, or None if routing fell back to
+                get_semantic_route
+        """
+        key = _normalize_query(message)
+        cached = self._route_cache.get(key)
+        if cached is not None:
+            self._route_cache.move_to_end(key)
+            return cached
+        combined = await self.get_combined_route(message)
+        if combined is None:
+            return await self.get_semantic_route(message), None
+        self._route_cache[key] = combined
+        if len(self._route_cache) > _ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
+        return combined
+
     async def route_message(
-        self, route: SemanticRouterResponse, message: str
+        self,
+        route: SemanticRouterResponse,
+        message: str,
+        payload: TokenSendPayload | None = None,
     ) -> dict[str, str]:
         """
         Route a message to the appropriate handler based on semantic route.
@@ -196,19 +434,15 @@ class ChatRouter:
         Args:
             route: Determined semantic route
             message: Original message to handle
+            payload: Parameters already extracted by get_combined_route, if any
 
         Returns:
             dict[str, str]: Response from the appropriate handler
         """
-        handlers = {
-            SemanticRouterResponse.GENERATE_ACCOUNT: self.handle_generate_account,
-            SemanticRouterResponse.SEND_TOKEN: self.handle_send_token,
-            SemanticRouterResponse.SWAP_TOKEN: self.handle_swap_token,
-            SemanticRouterResponse.REQUEST_ATTESTATION: self.handle_attestation,
-            SemanticRouterResponse.CONVERSATIONAL: self.handle_conversation,
-        }
+        if route == SemanticRouterResponse.SEND_TOKEN and payload is not None:
+            return await self.handle_send_token(message, payload)
 
-        handler = handlers.get(route)
+        handler = self._handlers.get(route)
         if not handler:
             return {"response": "Unsupported route"}
 
@@ -231,52 +465,98 @@ class ChatRouter:
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
             "generate_account", address=address
         )
-        gen_address_response = self.ai.generate(
+        gen_address_response = await self.ai.generate(
             prompt=prompt, response_mime_type=mime_type, response_schema=schema
         )
         return {"response": gen_address_response.text}
 
-    async def handle_send_token(self, message: str) -> dict[str, str]:
+    async def handle_send_token(
+        self, message: str, send_token_json: TokenSendPayload | None = None
+    ) -> dict[str, str]:
         """
         Handle token sending requests.
 
         Args:
             message: Message containing token sending details
+            send_token_json: Already extracted send parameters; when omitted they
+                are extracted from the message with a separate AI call
 
         Returns:
-            dict[str, str]: Response containing transaction preview or follow-up prompt
+            dict[str, str]: Response containing transaction preview or follow-up prompt,
+                prefixed with the account welcome message if an account had to be
+                generated first
         """
-        if not self.blockchain.address:
-            await self.handle_generate_account(message)
+        account_response: dict[str, str] | None = None
+        if send_token_json is None:
+            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                "token_send", user_input=message
+            )
+            extract_params = self.ai.generate(
+                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            )
+            if self.blockchain.address:
+                send_token_response = await extract_params
+            else:
+                # Account generation and parameter extraction are independent
+                # AI calls, so run them concurrently
+                account_response, send_token_response = await asyncio.gather(
+                    self.handle_generate_account(message), extract_params
+                )
+            payload = _SEND_PAYLOAD.validate_json(send_token_response.text)
+        else:
+            payload = send_token_json
+            if not self.blockchain.address:
+                account_response = await self.handle_generate_account(message)
 
-        prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-            "token_send", user_input=message
-        )
-        send_token_response = self.ai.generate(
-            prompt=prompt, response_mime_type=mime_type, response_schema=schema
-        )
-        send_token_json = json.loads(send_token_response.text)
-        expected_json_len = 2
         if (
-            len(send_token_json) != expected_json_len
-            or send_token_json.get("amount") == 0.0
+            "to_address" not in payload
+            or "amount" not in payload
+            or payload["amount"] == 0.0
         ):
             prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
-            follow_up_response = self.ai.generate(prompt)
-            return {"response": follow_up_response.text}
+            follow_up_response = await self.ai.cached_generate(prompt)
+            return self._with_account_response(
+                account_response, follow_up_response.text
+            )
 
-        tx = self.blockchain.create_send_flr_tx(
-            to_address=send_token_json.get("to_address"),
-            amount=send_token_json.get("amount"),
-        )
+        try:
+            tx = await self.blockchain.create_send_flr_tx(
+                to_address=payload["to_address"], amount=payload["amount"]
+            )
+        except Web3RPCError as e:
+            # Any of the concurrent node lookups can fail; report it like a failed
+            # send instead of failing the request
+            self.logger.exception("create_tx_failed", error=str(e))
+            msg = f"Unfortunately the tx could not be created:\n{e.args[0]}"
+            return self._with_account_response(account_response, msg)
         self.logger.debug("send_token_tx", tx=tx)
         self.blockchain.add_tx_to_queue(msg=message, tx=tx)
+        value_wei = tx.get("value", 0)
+        tx_to = tx.get("to")
         formatted_preview = (
             "Transaction Preview: "
-            + f"Sending {Web3.from_wei(tx.get('value', 0), 'ether')} "
-            + f"FLR to {tx.get('to')}\nType CONFIRM to proceed."
+            + f"Sending {_format_flr(value_wei)} "
+            + f"FLR to {tx_to}\nType CONFIRM to proceed."
         )
-        return {"response": formatted_preview}
+        return self._with_account_response(account_response, formatted_preview)
+
+    @staticmethod
+    def _with_account_response(
+        account_response: dict[str, str] | None, text: str
+    ) -> dict[str, str]:
+        """
+        Build a handler response, prefixed with an account generation response.
+
+        Args:
+            account_response: Response from handle_generate_account, if it ran
+            text: Response text of the current handler
+
+        Returns:
+            dict[str, str]: Combined response
+        """
+        if account_response is None:
+            return {"response": text}
+        return {"response": f"{account_response['response']}\n\n{text}"}
 
     async def handle_swap_token(self, _: str) -> dict[str, str]:
         """
@@ -301,7 +581,7 @@ class ChatRouter:
             dict[str, str]: Response containing attestation request
         """
         prompt = self.prompts.get_formatted_prompt("request_attestation")[0]
-        request_attestation_response = self.ai.generate(prompt=prompt)
+        request_attestation_response = await self.ai.cached_generate(prompt)
         self.attestation.attestation_requested = True
         return {"response": request_attestation_response.text}
 
@@ -315,5 +595,5 @@ class ChatRouter:
         Returns:
             dict[str, str]: Response from AI provider
         """
-        response = self.ai.send_message(message)
+        response = await self.ai.send_message(message)
         return {"response": response.text}
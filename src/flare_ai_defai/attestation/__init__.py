@@ -1,7 +1,9 @@
 from .vtpm_attestation import (
+    TokenType,
     Vtpm,
     VtpmAttestationError,
 )
+from .vtpm_batching import AsyncBatchingVtpm
 from .vtpm_validation import (
     CertificateParsingError,
     InvalidCertificateChainError,
@@ -11,9 +13,11 @@ from .vtpm_validation import (
 )
 
 __all__ = [
+    "AsyncBatchingVtpm",
     "CertificateParsingError",
     "InvalidCertificateChainError",
     "SignatureValidationError",
+    "TokenType",
     "Vtpm",
     "VtpmAttestationError",
     "VtpmValidation",
@@ -2,31 +2,82 @@
 Client for communicating with the Confidential Space vTPM attestation service.
 
 This module provides a client to request attestation tokens from a local Unix domain
-socket endpoint. It extends HTTPConnection to handle Unix socket communication and
-implements token request functionality with nonce validation.
+socket endpoint. It uses an httpx.AsyncClient over a Unix socket transport, so token
+requests reuse pooled connections without blocking the event loop, and implements
+token request functionality with nonce validation.
 
 Classes:
     VtpmAttestationError: Exception for attestation service communication errors
     VtpmAttestation: Client for requesting attestation tokens
 """
 
-import json
+import asyncio
 import socket
-from http.client import HTTPConnection
+import time
+from collections import OrderedDict
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Final, Literal
 
+import httpx
+import orjson
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+type TokenType = Literal["OIDC", "PKI"]
 
+_DEFAULT_TOKEN_TYPE: Final[TokenType] = "OIDC"
+_MIN_NONCE_BYTES: Final = 10
+_MAX_NONCE_BYTES: Final = 74
+_TOKEN_CACHE_SIZE: Final = 64
+_NONCE_REPLAY_WINDOW_S: Final = 3600.0
+_SEEN_NONCES_SIZE: Final = 4096
+_JSON_HEADERS: Final = {"Content-Type": "application/json"}
+# Larger socket buffers let PKI token responses, which carry a certificate chain,
+# arrive in fewer reads
+_SOCKET_BUFFER_SIZE: Final = 256 * 1024
+_SOCKET_OPTIONS: Final = [
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE),
+]
+_POOL_LIMITS: Final = httpx.Limits(
+    max_connections=32, max_keepalive_connections=32, keepalive_expiry=60.0
+)
+_SIM_TOKEN_PATH: Final = Path(__file__).parent / "simulated_token.txt"
+
+
+@cache
 def get_simulated_token() -> str:
-    """Reads the first line from a given file path."""
-    with (Path(__file__).parent / "simulated_token.txt").open("r") as f:
+    """Reads the first line from a given file path, once, on first use."""
+    with _SIM_TOKEN_PATH.open("r") as f:
         return f.readline().strip()
 
 
-SIM_TOKEN = get_simulated_token()
+@lru_cache(maxsize=8)
+def _body_prefix(audience: str, token_type: TokenType) -> bytes:
+    """
+    Return the encoded token request body up to the opening bracket of the nonces.
+
+    Args:
+        audience: Intended audience for the token
+        token_type: Type of token
+
+    Returns:
+        bytes: JSON body prefix, ending in '"nonces":['
+    """
+    body = orjson.dumps({"audience": audience, "token_type": token_type, "nonces": []})
+    return body.removesuffix(b"]}")
+
+
+def _utf8_len(text: str) -> int:
+    """
+    Return the UTF-8 encoded length of a string.
+
+    ASCII strings encode to one byte per character, so only non-ASCII strings are
+    actually encoded.
+    """
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
 
 
 class VtpmAttestationError(Exception):
@@ -40,18 +91,36 @@ class VtpmAttestationError(Exception):
 
 class Vtpm:
     """
-    Client for requesting attestation tokens via Unix domain socket."""
+    Client for requesting attestation tokens via Unix domain socket.
+
+    Tokens are requested fresh on every call unless cache_ttl_s is set, in which
+    case identical requests (same nonces, audience and token type) within that many
+    seconds reuse the previous token. Only enable it for callers that deliberately
+    reuse a fixed nonce, such as health checks.
+
+    Without the cache, nonces are single-use: a nonce already sent within the last
+    hour is rejected locally instead of being sent to the service.
+    """
 
     def __init__(
         self,
         url: str = "http://localhost/v1/token",
         unix_socket_path: str = "/run/container_launcher/teeserver.sock",
         simulate: bool = False,  # noqa: FBT001, FBT002
+        cache_ttl_s: float = 0.0,
     ) -> None:
         self.url = url
         self.unix_socket_path = unix_socket_path
         self.simulate = simulate
+        self.cache_ttl_s = cache_ttl_s
         self.attestation_requested: bool = False
+        self._token_cache: OrderedDict[
+            tuple[tuple[str, ...], str, TokenType], tuple[float, str]
+        ] = OrderedDict()
+        self._seen_nonces: OrderedDict[str, float] = OrderedDict()
+        # One pooled client for the lifetime of the app, created by the first
+        # real token request, so simulated clients never open one
+        self._client: httpx.AsyncClient | None = None
         self.logger = logger.bind(router="vtpm")
         self.logger.debug(
             "vtpm", simulate=simulate, url=url, unix_socket_path=self.unix_socket_path
@@ -69,21 +138,63 @@ class Vtpm:
         Raises:
             VtpmAttestationError: If any nonce is outside the valid length range
         """
-        min_byte_len = 10
-        max_byte_len = 74
+        # next() stops at the first nonce outside the range
+        invalid = next(
+            (
+                nonce
+                for nonce in nonces
+                if not _MIN_NONCE_BYTES <= _utf8_len(nonce) <= _MAX_NONCE_BYTES
+            ),
+            None,
+        )
+        if invalid is not None:
+            msg = (
+                f"Nonce '{invalid}' must be between {_MIN_NONCE_BYTES} bytes"
+                f" and {_MAX_NONCE_BYTES} bytes"
+            )
+            raise VtpmAttestationError(msg)
+
+    def _check_replay(self, nonces: list[str]) -> None:
+        """
+        Reject nonces that were already sent, then reserve them as used.
+
+        Nonces are remembered for an hour, and only the most recent ones are kept.
+        Reserving them before the request also rejects concurrent requests with
+        the same nonce; get_token releases them again if the request fails.
+
+        Args:
+            nonces: List of nonce strings to validate
+
+        Raises:
+            VtpmAttestationError: If a nonce was already used or is repeated
+        """
+        now = time.monotonic()
+        seen = self._seen_nonces
+        while seen and next(iter(seen.values())) + _NONCE_REPLAY_WINDOW_S < now:
+            seen.popitem(last=False)
+        if len(set(nonces)) != len(nonces) or not seen.keys().isdisjoint(nonces):
+            msg = "Nonces must not be reused"
+            raise VtpmAttestationError(msg)
+        for nonce in nonces:
+            seen[nonce] = now
+        while len(seen) > _SEEN_NONCES_SIZE:
+            seen.popitem(last=False)
+
+    def _release_nonces(self, nonces: list[str]) -> None:
+        """
+        Forget reserved nonces whose token request failed, so they can be retried.
+
+        Args:
+            nonces: Nonces reserved by _check_replay
+        """
         for nonce in nonces:
-            byte_len = len(nonce.encode("utf-8"))
-            self.logger.debug("nonce_length", byte_len=byte_len)
-            if byte_len < min_byte_len or byte_len > max_byte_len:
-                msg = f"Nonce '{nonce}' must be between {min_byte_len} bytes"
-                f" and {max_byte_len} bytes"
-                raise VtpmAttestationError(msg)
-
-    def get_token(
+            self._seen_nonces.pop(nonce, None)
+
+    async def get_token(
         self,
         nonces: list[str],
         audience: str = "https://sts.google.com",
-        token_type: str = "OIDC",  # noqa: S107
+        token_type: TokenType = _DEFAULT_TOKEN_TYPE,
     ) -> str:
         """
         Request an attestation token from the service.
@@ -102,11 +213,11 @@ class Vtpm:
 
         Raises:
             VtpmAttestationError: If token request fails for any reason
-                (invalid nonces, service unavailable, etc.)
+                (invalid or reused nonces, service unavailable, etc.)
 
         Example:
-            client = VtpmAttestation()
-            token = client.get_token(
+            client = Vtpm()
+            token = await client.get_token(
                 nonces=["random_nonce"],
                 audience="https://my-service.example.com",
                 token_type="OIDC"
@@ -114,33 +225,108 @@ class Vtpm:
         """
         self._check_nonce_length(nonces)
         if self.simulate:
-            self.logger.debug("sim_token", token=SIM_TOKEN)
-            return SIM_TOKEN
+            return get_simulated_token()
+        if not self.cache_ttl_s:
+            self._check_replay(nonces)
+            try:
+                return await self._request_token(nonces, audience, token_type)
+            except BaseException:
+                # No token was issued for these nonces, so a retry is not a replay
+                self._release_nonces(nonces)
+                raise
 
-        # Connect to the socket
-        client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        client_socket.connect(self.unix_socket_path)
+        key = (tuple(nonces), audience, token_type)
+        cached = self._token_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._token_cache.move_to_end(key)
+            return cached[1]
+        token = await self._request_token(nonces, audience, token_type)
+        self._token_cache[key] = (time.monotonic() + self.cache_ttl_s, token)
+        self._token_cache.move_to_end(key)
+        if len(self._token_cache) > _TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return token
 
-        # Create an HTTP connection object
-        conn = HTTPConnection("localhost", timeout=10)
-        conn.sock = client_socket
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled client for the attestation service, creating it on first use.
 
-        # Send a POST request
-        headers = {"Content-Type": "application/json"}
-        body = json.dumps(
-            {"audience": audience, "token_type": token_type, "nonces": nonces}
-        )
-        conn.request("POST", self.url, body=body, headers=headers)
+        Returns:
+            httpx.AsyncClient: Client connected through the service's Unix socket
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    uds=self.unix_socket_path, socket_options=_SOCKET_OPTIONS
+                ),
+                headers=_JSON_HEADERS,
+                limits=_POOL_LIMITS,
+                timeout=10,
+            )
+        return self._client
+
+    async def _request_token(
+        self, nonces: list[str], audience: str, token_type: TokenType
+    ) -> str:
+        """
+        Post a token request to the attestation service.
+
+        Args:
+            nonces: Already validated nonce strings
+            audience: Intended audience for the token
+            token_type: Type of token, either "OIDC" or "PKI"
 
-        # Get and decode the response
-        res = conn.getresponse()
+        Returns:
+            str: The attestation token in JWT format
+
+        Raises:
+            VtpmAttestationError: If the service is unreachable or rejects the request
+        """
+        # Only the nonces vary between requests; splice them into the cached prefix
+        body = _body_prefix(audience, token_type) + orjson.dumps(nonces)[1:] + b"}"
+        try:
+            res = await self._get_client().post(self.url, content=body)
+        except httpx.HTTPError as e:
+            msg = f"Failed to reach attestation service: {e}"
+            raise VtpmAttestationError(msg) from e
         success_status = 200
-        if res.status != success_status:
-            msg = f"Failed to get attestation response: {res.status} {res.reason}"
+        if res.status_code != success_status:
+            msg = (
+                f"Failed to get attestation response: {res.status_code} "
+                f"{res.reason_phrase}"
+            )
             raise VtpmAttestationError(msg)
-        token = res.read().decode()
-        self.logger.debug("token", token_type=token_type, token=token)
+        # JWTs are base64url segments, so ASCII decoding is sufficient. The token
+        # itself is a credential and is not logged.
+        self.logger.debug("token", token_type=token_type, size=len(res.content))
+        return res.content.decode("ascii")
 
-        # Close the connection
-        conn.close()
-        return token
+    async def connect(self) -> None:
+        """
+        Check that the attestation service socket accepts connections.
+
+        Meant to run at application startup, so a missing or unresponsive socket is
+        reported immediately rather than on the first token request. Does nothing
+        when simulating.
+
+        Raises:
+            VtpmAttestationError: If the socket cannot be connected to
+        """
+        if self.simulate:
+            return
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.unix_socket_path), timeout=10
+            )
+        except (OSError, TimeoutError) as e:
+            msg = f"Attestation service socket unavailable: {e}"
+            raise VtpmAttestationError(msg) from e
+        writer.close()
+        await writer.wait_closed()
+        self.logger.debug("vtpm_connected", unix_socket_path=self.unix_socket_path)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections to the attestation service."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,169 @@
+"""
+Batching client for the Confidential Space vTPM attestation service.
+
+The attestation service accepts several nonces per token request, and the returned
+token carries all of them in its eat_nonce claim. This module merges token requests
+that arrive close together into a single request to the service, so concurrent
+callers share one round-trip over the Unix socket instead of queueing behind each
+other.
+
+Classes:
+    AsyncBatchingVtpm: Vtpm client that coalesces concurrent token requests
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import structlog
+
+from flare_ai_defai.attestation.vtpm_attestation import TokenType, Vtpm
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _TokenRequest:
+    """A pending token request waiting to be merged into a batch."""
+
+    nonces: list[str]
+    audience: str
+    token_type: TokenType
+    future: asyncio.Future[str] = field(repr=False)
+
+
+class AsyncBatchingVtpm(Vtpm):
+    """
+    Vtpm client that merges concurrent token requests into one service call.
+
+    A background task collects requests for up to batch_wait_timeout_s after the
+    first one arrives, or until max_batch_nonces nonces are pending, and issues a
+    single token request with all of their nonces. Every caller in the batch receives
+    the same token, which includes each caller's nonces. Only requests with the same
+    audience and token type are merged.
+
+    Attributes:
+        max_batch_nonces (int): Maximum number of nonces sent in one request
+        batch_wait_timeout_s (float): Time to wait for more requests to merge
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str = "http://localhost/v1/token",
+        unix_socket_path: str = "/run/container_launcher/teeserver.sock",
+        simulate: bool = False,  # noqa: FBT001, FBT002
+        *,
+        cache_ttl_s: float = 0.0,
+        max_batch_nonces: int = 6,
+        batch_wait_timeout_s: float = 0.002,
+    ) -> None:
+        """
+        Initialize the batching client.
+
+        Args:
+            url: Token endpoint of the attestation service
+            unix_socket_path: Path of the attestation service socket
+            simulate: Return the simulated token instead of calling the service
+            cache_ttl_s: Seconds to reuse the token for identical requests; 0
+                disables caching
+            max_batch_nonces: Maximum number of nonces sent in one request; the
+                Confidential Space token service accepts at most six
+            batch_wait_timeout_s: Time to wait for more requests to merge
+        """
+        super().__init__(
+            url=url,
+            unix_socket_path=unix_socket_path,
+            simulate=simulate,
+            cache_ttl_s=cache_ttl_s,
+        )
+        self.max_batch_nonces = max_batch_nonces
+        self.batch_wait_timeout_s = batch_wait_timeout_s
+        self._queue: asyncio.Queue[_TokenRequest] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def _request_token(
+        self, nonces: list[str], audience: str, token_type: TokenType
+    ) -> str:
+        """
+        Queue a token request to be sent with the next batch.
+
+        Requests with more nonces than fit in one batch are sent on their own.
+
+        Args:
+            nonces: Already validated nonce strings
+            audience: Intended audience for the token
+            token_type: Type of token, either "OIDC" or "PKI"
+
+        Returns:
+            str: The attestation token in JWT format, shared with the whole batch
+
+        Raises:
+            VtpmAttestationError: If the batched request fails
+        """
+        if len(nonces) > self.max_batch_nonces:
+            return await super()._request_token(nonces, audience, token_type)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self._queue.put(_TokenRequest(nonces, audience, token_type, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and send them one at a time."""
+        loop = asyncio.get_running_loop()
+        held: _TokenRequest | None = None
+        while True:
+            first = held if held is not None else await self._queue.get()
+            held = None
+            batch = [first]
+            nonce_count = len(first.nonces)
+            deadline = loop.time() + self.batch_wait_timeout_s
+            while nonce_count < self.max_batch_nonces:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if (
+                    request.audience != first.audience
+                    or request.token_type != first.token_type
+                    or nonce_count + len(request.nonces) > self.max_batch_nonces
+                ):
+                    # Start the next batch with the request that did not fit
+                    held = request
+                    break
+                batch.append(request)
+                nonce_count += len(request.nonces)
+            await self._send_batch(batch)
+
+    async def _send_batch(self, batch: list[_TokenRequest]) -> None:
+        """
+        Send one token request for a batch and resolve every waiting caller.
+
+        Args:
+            batch: Requests sharing an audience and token type
+        """
+        first = batch[0]
+        nonces = [nonce for request in batch for nonce in request.nonces]
+        self.logger.debug("vtpm_batch", requests=len(batch), nonces=len(nonces))
+        try:
+            token = await super()._request_token(
+                nonces, first.audience, first.token_type
+            )
+        except Exception as e:  # noqa: BLE001
+            # Hand the failure to every caller; the worker keeps serving batches
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        for request in batch:
+            if not request.future.done():
+                request.future.set_result(token)
+
+    async def aclose(self) -> None:
+        """Stop the batching task and close the pooled connections."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        await super().aclose()
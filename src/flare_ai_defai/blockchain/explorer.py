@@ -1,6 +1,6 @@
-import json
 import logging
 
+import orjson
 import requests
 from requests.exceptions import RequestException, Timeout
 
@@ -23,7 +23,7 @@ class FlareExplorer:
                 self.base_url, params=params, headers=headers, timeout=10
             )
             response.raise_for_status()
-            json_response = response.json()
+            json_response = orjson.loads(response.content)
 
             if "result" not in json_response:
                 msg = (f"Malformed response from API: {json_response}",)
@@ -49,4 +49,4 @@ class FlareExplorer:
                 "address": contract_address,
             }
         )
-        return json.loads(response["result"])
+        return orjson.loads(response["result"])
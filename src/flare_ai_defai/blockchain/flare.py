@@ -5,16 +5,23 @@ This module provides a FlareProvider class for interacting with the Flare Networ
 It handles account management, transaction queuing, and blockchain interactions.
 """
 
+import asyncio
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 import structlog
 from eth_account import Account
 from eth_typing import ChecksumAddress
-from web3 import Web3
+from web3 import AsyncWeb3
 from web3.types import TxParams
 
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TxQueueElement:
     """
     Represents a transaction in the queue with its associated message.
@@ -30,6 +37,12 @@ class TxQueueElement:
 
 logger = structlog.get_logger(__name__)
 
+# Fields shared by every FLR transfer; each transaction starts from a copy
+_BASE_TX: Final[TxParams] = {"gas": 21000, "type": 2}
+
+# Checksumming hashes the address with Keccak-256; repeat recipients skip it
+_to_checksum_address = lru_cache(maxsize=512)(AsyncWeb3.to_checksum_address)
+
 
 class FlareProvider:
     """
@@ -39,8 +52,8 @@ class FlareProvider:
     Attributes:
         address (ChecksumAddress | None): The account's checksum address
         private_key (str | None): The account's private key
-        tx_queue (list[TxQueueElement]): Queue of pending transactions
-        w3 (Web3): Web3 instance for blockchain interactions
+        tx_queue (deque[TxQueueElement]): Queue of pending transactions
+        w3 (AsyncWeb3): Async Web3 instance for blockchain interactions
         logger (BoundLogger): Structured logger for the provider
     """
 
@@ -53,8 +66,11 @@ class FlareProvider:
         """
         self.address: ChecksumAddress | None = None
         self.private_key: str | None = None
-        self.tx_queue: list[TxQueueElement] = []
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        # Signing through the account skips re-parsing the hex key on every send
+        self._account: LocalAccount | None = None
+        self.tx_queue: deque[TxQueueElement] = deque()
+        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(web3_provider_url))
+        self._chain_id: int | None = None
         self.logger = logger.bind(router="flare_provider")
 
     def reset(self) -> None:
@@ -63,7 +79,8 @@ class FlareProvider:
         """
         self.address = None
         self.private_key = None
-        self.tx_queue = []
+        self._account = None
+        self.tx_queue.clear()
         self.logger.debug("reset", address=self.address, tx_queue=self.tx_queue)
 
     def add_tx_to_queue(self, msg: str, tx: TxParams) -> None:
@@ -76,9 +93,12 @@ class FlareProvider:
         """
         tx_queue_element = TxQueueElement(msg=msg, tx=tx)
         self.tx_queue.append(tx_queue_element)
-        self.logger.debug("add_tx_to_queue", tx_queue=self.tx_queue)
+        # Log the size rather than the whole queue, which renders every pending tx
+        self.logger.debug(
+            "add_tx_to_queue", tx_queue_len=len(self.tx_queue), msg=tx_queue_element.msg
+        )
 
-    def send_tx_in_queue(self) -> str:
+    async def send_tx_in_queue(self) -> str:
         """
         Send the most recent transaction in the queue.
 
@@ -89,7 +109,7 @@ class FlareProvider:
             ValueError: If no transaction is found in the queue
         """
         if self.tx_queue:
-            tx_hash = self.sign_and_send_transaction(self.tx_queue[-1].tx)
+            tx_hash = await self.sign_and_send_transaction(self.tx_queue[-1].tx)
             self.logger.debug("sent_tx_hash", tx_hash=tx_hash)
             self.tx_queue.pop()
             return tx_hash
@@ -104,14 +124,15 @@ class FlareProvider:
             ChecksumAddress: The checksum address of the generated account
         """
         account = Account.create()
+        self._account = account
         self.private_key = account.key.hex()
-        self.address = self.w3.to_checksum_address(account.address)
+        self.address = _to_checksum_address(account.address)
         self.logger.debug(
             "generate_account", address=self.address, private_key=self.private_key
         )
         return self.address
 
-    def sign_and_send_transaction(self, tx: TxParams) -> str:
+    async def sign_and_send_transaction(self, tx: TxParams) -> str:
         """
         Sign and send a transaction to the network.
 
@@ -124,18 +145,16 @@ class FlareProvider:
         Raises:
             ValueError: If account is not initialized
         """
-        if not self.private_key or not self.address:
+        if self._account is None or not self.address:
             msg = "Account not initialized"
             raise ValueError(msg)
-        signed_tx = self.w3.eth.account.sign_transaction(
-            tx, private_key=self.private_key
-        )
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        signed_tx = self._account.sign_transaction(tx)  # pyright: ignore [reportArgumentType]
+        tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        await self.w3.eth.wait_for_transaction_receipt(tx_hash)
         self.logger.debug("sign_and_send_transaction", tx=tx)
         return "0x" + tx_hash.hex()
 
-    def check_balance(self) -> float:
+    async def check_balance(self) -> float:
         """
         Check the balance of the current account.
 
@@ -148,14 +167,17 @@ class FlareProvider:
         if not self.address:
             msg = "Account does not exist"
             raise ValueError(msg)
-        balance_wei = self.w3.eth.get_balance(self.address)
+        balance_wei = await self.w3.eth.get_balance(self.address)
         self.logger.debug("check_balance", balance_wei=balance_wei)
         return float(self.w3.from_wei(balance_wei, "ether"))
 
-    def create_send_flr_tx(self, to_address: str, amount: float) -> TxParams:
+    async def create_send_flr_tx(self, to_address: str, amount: float) -> TxParams:
         """
         Create a transaction to send FLR tokens.
 
+        The nonce and fee lookups are independent, so they are requested from the
+        node concurrently. The chain id is fetched once and then reused.
+
         Args:
             to_address (str): Recipient address
             amount (float): Amount of FLR to send
@@ -169,15 +191,33 @@ class FlareProvider:
         if not self.address:
             msg = "Account does not exist"
             raise ValueError(msg)
-        tx: TxParams = {
-            "from": self.address,
-            "nonce": self.w3.eth.get_transaction_count(self.address),
-            "to": self.w3.to_checksum_address(to_address),
-            "value": self.w3.to_wei(amount, unit="ether"),
-            "gas": 21000,
-            "maxFeePerGas": self.w3.eth.gas_price,
-            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-            "chainId": self.w3.eth.chain_id,
-            "type": 2,
-        }
+        nonce, gas_price, max_priority_fee, chain_id = await asyncio.gather(
+            self.w3.eth.get_transaction_count(self.address),
+            self.w3.eth.gas_price,
+            self.w3.eth.max_priority_fee,
+            self._get_chain_id(),
+        )
+        tx = _BASE_TX.copy()
+        tx["from"] = self.address
+        tx["nonce"] = nonce
+        tx["to"] = _to_checksum_address(to_address)
+        tx["value"] = self.w3.to_wei(amount, unit="ether")
+        tx["maxFeePerGas"] = gas_price
+        tx["maxPriorityFeePerGas"] = max_priority_fee
+        tx["chainId"] = chain_id
         return tx
+
+    async def _get_chain_id(self) -> int:
+        """
+        Return the chain id of the connected network, fetching it on first use.
+
+        Returns:
+            int: Chain id reported by the Web3 provider
+        """
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        return self._chain_id
+
+    async def aclose(self) -> None:
+        """Close the connection to the Web3 provider."""
+        await self.w3.provider.disconnect()
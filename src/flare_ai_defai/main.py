@@ -12,11 +12,15 @@ Dependencies:
     - Custom providers for AI, blockchain, and attestation services
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from flare_ai_defai import (
+    AsyncBatchingVtpm,
     ChatRouter,
     FlareProvider,
     GeminiProvider,
@@ -38,9 +42,11 @@ def create_app() -> FastAPI:
     3. Initializes required service providers:
        - GeminiProvider for AI capabilities
        - FlareProvider for blockchain interactions
-       - Vtpm for attestation services
+       - Vtpm, or AsyncBatchingVtpm when batching is enabled, for attestation
        - PromptService for managing chat prompts
     4. Sets up routing for chat endpoints
+    5. Checks the attestation socket on startup and closes the attestation and
+       Web3 provider clients on shutdown
 
     Returns:
         FastAPI: Configured FastAPI application instance
@@ -53,9 +59,32 @@ def create_app() -> FastAPI:
         - gemini_model: Model identifier for Gemini AI
         - web3_provider_url: URL for Web3 provider
         - simulate_attestation: Boolean flag for attestation simulation
+        - attestation_batch_size: Nonces merged per attestation request, 0 to
+          disable batching
     """
+    attestation = (
+        AsyncBatchingVtpm(
+            simulate=settings.simulate_attestation,
+            max_batch_nonces=settings.attestation_batch_size,
+        )
+        if settings.attestation_batch_size > 0
+        else Vtpm(simulate=settings.simulate_attestation)
+    )
+
+    blockchain = FlareProvider(web3_provider_url=settings.web3_provider_url)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        await attestation.connect()
+        yield
+        await attestation.aclose()
+        await blockchain.aclose()
+
     app = FastAPI(
-        title="AI Agent API", version=settings.api_version, redirect_slashes=False
+        title="AI Agent API",
+        version=settings.api_version,
+        redirect_slashes=False,
+        lifespan=lifespan,
     )
 
     # Configure CORS middleware with settings from configuration
@@ -70,8 +99,8 @@ def create_app() -> FastAPI:
     # Initialize router with service providers
     chat = ChatRouter(
         ai=GeminiProvider(api_key=settings.gemini_api_key, model=settings.gemini_model),
-        blockchain=FlareProvider(web3_provider_url=settings.web3_provider_url),
-        attestation=Vtpm(simulate=settings.simulate_attestation),
+        blockchain=blockchain,
+        attestation=attestation,
         prompts=PromptService(),
     )
 
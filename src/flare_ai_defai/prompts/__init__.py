@@ -1,5 +1,10 @@
 from .library import PromptLibrary
-from .schemas import SemanticRouterResponse
+from .schemas import SemanticRouterResponse, TokenSendPayload
 from .service import PromptService
 
-__all__ = ["PromptLibrary", "PromptService", "SemanticRouterResponse"]
+__all__ = [
+    "PromptLibrary",
+    "PromptService",
+    "SemanticRouterResponse",
+    "TokenSendPayload",
+]
@@ -18,16 +18,22 @@ Example:
     ```
 """
 
+from types import MappingProxyType
+from typing import Final
+
 import structlog
 
 from flare_ai_defai.prompts.schemas import (
+    CombinedRouterResponse,
     Prompt,
     SemanticRouterResponse,
     TokenSendResponse,
     TokenSwapResponse,
 )
 from flare_ai_defai.prompts.templates import (
+    COMBINED_ROUTER_AND_ACTION,
     CONVERSATIONAL,
+    FOLLOW_UP_TOKEN_SEND,
     GENERATE_ACCOUNT,
     REMOTE_ATTESTATION,
     SEMANTIC_ROUTER,
@@ -38,6 +44,91 @@ from flare_ai_defai.prompts.templates import (
 
 logger = structlog.get_logger(__name__)
 
+# Built once at import and shared by every PromptLibrary instance
+_DEFAULT_PROMPTS: tuple[Prompt, ...] = (
+    Prompt(
+        name="semantic_router",
+        description="Route user query based on user input",
+        template=SEMANTIC_ROUTER,
+        required_inputs=["user_input"],
+        response_mime_type="text/x.enum",
+        response_schema=SemanticRouterResponse,
+        category="router",
+    ),
+    Prompt(
+        name="combined_router_and_action",
+        description="Route user query and extract handler parameters",
+        template=COMBINED_ROUTER_AND_ACTION,
+        required_inputs=["user_input"],
+        response_mime_type="application/json",
+        response_schema=CombinedRouterResponse,
+        category="router",
+    ),
+    Prompt(
+        name="token_send",
+        description="Extract token send parameters from user input",
+        template=TOKEN_SEND,
+        required_inputs=["user_input"],
+        response_mime_type="application/json",
+        response_schema=TokenSendResponse,
+        category="defai",
+    ),
+    Prompt(
+        name="follow_up_token_send",
+        description="Ask the user for missing token send parameters",
+        template=FOLLOW_UP_TOKEN_SEND,
+        required_inputs=None,
+        response_schema=None,
+        response_mime_type=None,
+        category="defai",
+    ),
+    Prompt(
+        name="token_swap",
+        description="Extract token swap parameters from user input",
+        template=TOKEN_SWAP,
+        required_inputs=["user_input"],
+        response_schema=TokenSwapResponse,
+        response_mime_type="application/json",
+        category="defai",
+    ),
+    Prompt(
+        name="generate_account",
+        description="Generate a new account for a user",
+        template=GENERATE_ACCOUNT,
+        required_inputs=["address"],
+        response_schema=None,
+        response_mime_type=None,
+        category="account",
+    ),
+    Prompt(
+        name="conversational",
+        description="Converse with a user",
+        template=CONVERSATIONAL,
+        required_inputs=["user_input"],
+        response_schema=None,
+        response_mime_type=None,
+        category="conversational",
+    ),
+    Prompt(
+        name="request_attestation",
+        description="User has requested a remote attestation",
+        template=REMOTE_ATTESTATION,
+        required_inputs=None,
+        response_schema=None,
+        response_mime_type=None,
+        category="conversational",
+    ),
+    Prompt(
+        name="tx_confirmation",
+        description="Confirm a user's transaction",
+        template=TX_CONFIRMATION,
+        required_inputs=["tx_hash", "block_explorer"],
+        response_schema=None,
+        response_mime_type=None,
+        category="account",
+    ),
+)
+
 
 class PromptLibrary:
     """
@@ -51,6 +142,9 @@ class PromptLibrary:
     Attributes:
         prompts (dict[str, Prompt]): Dictionary storing prompt objects
             with their names as keys.
+        prompts_view (MappingProxyType[str, Prompt]): Read-only view of prompts.
+        _by_category (dict[str, list[Prompt]]): Index of prompts by category,
+            kept in step with prompts by add_prompt.
 
     Example:
         ```python
@@ -68,15 +162,20 @@ class PromptLibrary:
         through the _initialize_default_prompts method.
         """
         self.prompts: dict[str, Prompt] = {}
+        self._prompts_view = MappingProxyType(self.prompts)
+        self._by_category: dict[str, list[Prompt]] = {}
         self._initialize_default_prompts()
 
     def _initialize_default_prompts(self) -> None:
         """
         Initialize the library with a set of default prompts.
 
-        Creates and adds the following default prompts:
+        Adds the following default prompts from _DEFAULT_PROMPTS:
         - semantic_router: For routing user queries
+        - combined_router_and_action: For routing user queries and extracting
+          handler parameters in a single call
         - token_send: For token transfer operations
+        - follow_up_token_send: For asking about missing token transfer details
         - token_swap: For token swap operations
         - generate_account: For wallet generation
         - conversational: For general user interactions
@@ -85,74 +184,23 @@ class PromptLibrary:
 
         This method is called automatically during instance initialization.
         """
-        default_prompts = [
-            Prompt(
-                name="semantic_router",
-                description="Route user query based on user input",
-                template=SEMANTIC_ROUTER,
-                required_inputs=["user_input"],
-                response_mime_type="text/x.enum",
-                response_schema=SemanticRouterResponse,
-                category="router",
-            ),
-            Prompt(
-                name="token_send",
-                description="Extract token send parameters from user input",
-                template=TOKEN_SEND,
-                required_inputs=["user_input"],
-                response_mime_type="application/json",
-                response_schema=TokenSendResponse,
-                category="defai",
-            ),
-            Prompt(
-                name="token_swap",
-                description="Extract token swap parameters from user input",
-                template=TOKEN_SWAP,
-                required_inputs=["user_input"],
-                response_schema=TokenSwapResponse,
-                response_mime_type="application/json",
-                category="defai",
-            ),
-            Prompt(
-                name="generate_account",
-                description="Generate a new account for a user",
-                template=GENERATE_ACCOUNT,
-                required_inputs=["address"],
-                response_schema=None,
-                response_mime_type=None,
-                category="account",
-            ),
-            Prompt(
-                name="conversational",
-                description="Converse with a user",
-                template=CONVERSATIONAL,
-                required_inputs=["user_input"],
-                response_schema=None,
-                response_mime_type=None,
-                category="conversational",
-            ),
-            Prompt(
-                name="request_attestation",
-                description="User has requested a remote attestation",
-                template=REMOTE_ATTESTATION,
-                required_inputs=None,
-                response_schema=None,
-                response_mime_type=None,
-                category="conversational",
-            ),
-            Prompt(
-                name="tx_confirmation",
-                description="Confirm a user's transaction",
-                template=TX_CONFIRMATION,
-                required_inputs=["tx_hash", "block_explorer"],
-                response_schema=None,
-                response_mime_type=None,
-                category="account",
-            ),
-        ]
-
-        for prompt in default_prompts:
-            self.add_prompt(prompt)
+        # Indexed without logging: DEFAULT_LIBRARY is built at import time,
+        # before structlog is configured with the LOG_LEVEL filter
+        for prompt in _DEFAULT_PROMPTS:
+            self._index_prompt(prompt)
+
+    @property
+    def prompts_view(self) -> MappingProxyType[str, Prompt]:
+        """
+        Read-only view of the prompts, kept in step with add_prompt.
+
+        Hand this out instead of prompts so callers cannot change the shared
+        DEFAULT_LIBRARY behind the category index.
+
+        Returns:
+            MappingProxyType[str, Prompt]: Prompts keyed by name
+        """
+        return self._prompts_view
 
     def add_prompt(self, prompt: Prompt) -> None:
         """
@@ -170,9 +218,21 @@ class PromptLibrary:
             library.add_prompt(custom_prompt)
             ```
         """
-        self.prompts[prompt.name] = prompt
+        self._index_prompt(prompt)
         logger.debug("prompt_added", name=prompt.name, category=prompt.category)
 
+    def _index_prompt(self, prompt: Prompt) -> None:
+        """Store a prompt by name and category, replacing any with that name."""
+        replaced = self.prompts.get(prompt.name)
+        if replaced is not None and replaced.category is not None:
+            category_prompts = self._by_category[replaced.category]
+            category_prompts.remove(replaced)
+            if not category_prompts:
+                del self._by_category[replaced.category]
+        self.prompts[prompt.name] = prompt
+        if prompt.category is not None:
+            self._by_category.setdefault(prompt.category, []).append(prompt)
+
     def get_prompt(self, name: str) -> Prompt:
         """
         Retrieve a prompt by its name.
@@ -194,11 +254,12 @@ class PromptLibrary:
                 print("Prompt not found")
             ```
         """
-        if name not in self.prompts:
+        prompt = self.prompts.get(name)
+        if prompt is None:
             logger.error("prompt_not_found", name=name)
             msg = f"Prompt '{name}' not found in library"
             raise KeyError(msg)
-        return self.prompts[name]
+        return prompt
 
     def get_prompts_by_category(self, category: str) -> list[Prompt]:
         """
@@ -215,9 +276,7 @@ class PromptLibrary:
             defi_prompts = library.get_prompts_by_category("defai")
             ```
         """
-        return [
-            prompt for prompt in self.prompts.values() if prompt.category == category
-        ]
+        return list(self._by_category.get(category, ()))
 
     def list_categories(self) -> list[str]:
         """
@@ -232,10 +291,8 @@ class PromptLibrary:
             print("Available categories:", categories)
             ```
         """
-        return list(
-            {
-                prompt.category
-                for prompt in self.prompts.values()
-                if prompt.category is not None
-            }
-        )
+        return list(self._by_category)
+
+
+# Shared by every PromptService that is not given its own library
+DEFAULT_LIBRARY: Final = PromptLibrary()
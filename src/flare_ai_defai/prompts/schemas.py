@@ -11,10 +11,14 @@ interactions, ensuring consistency in prompt formatting and response handling
 across the application.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from string import Template
-from typing import TypedDict
+from typing import Any, TypedDict
+
+from pydantic import StrictStr, TypeAdapter
 
 
 class SemanticRouterResponse(str, Enum):
@@ -74,6 +78,115 @@ class TokenSwapResponse(TypedDict):
     amount: float
 
 
+class TokenSendPayload(TypedDict, total=False):
+    """
+    Route-specific parameters extracted alongside the semantic route.
+
+    Only populated for the SEND_TOKEN route; fields the model could not extract
+    are omitted.
+
+    Attributes:
+        to_address (str): The destination wallet address
+        amount (float): The amount of tokens to send
+    """
+
+    to_address: str
+    amount: float
+
+
+class CombinedRouterResponse(TypedDict):
+    """
+    Type definition for the fused semantic routing and parameter extraction call.
+
+    Attributes:
+        route (SemanticRouterResponse): The semantic route for the user input
+        payload (TokenSendPayload): Parameters for the selected route's handler
+    """
+
+    route: SemanticRouterResponse
+    payload: TokenSendPayload
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces so str.format treats them as text."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _parse_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """
+    Split a string.Template source into literal text and placeholder names.
+
+    $$ becomes a literal $, and a lone $ that does not start a placeholder is kept
+    as is, as safe_substitute does. Literal text and names are interned, so
+    fragments repeated across prompts are stored once and names match keyword
+    argument keys by identity.
+
+    Args:
+        template: Template text using $name or ${name} placeholders
+
+    Returns:
+        tuple[tuple[str, str | None], ...]: Pairs of literal text and the name of
+            the placeholder following it; the last pair has no placeholder
+    """
+    chunks: list[tuple[str, str | None]] = []
+    literal: list[str] = []
+    last = 0
+    for match in Template.pattern.finditer(template):
+        literal.append(template[last : match.start()])
+        name = match.group("named") or match.group("braced")
+        if name is not None:
+            chunks.append((sys.intern("".join(literal)), sys.intern(name)))
+            literal = []
+        else:
+            # Escaped "$$" and invalid placeholders both render as a single "$"
+            literal.append("$")
+        last = match.end()
+    literal.append(template[last:])
+    chunks.append((sys.intern("".join(literal)), None))
+    return tuple(chunks)
+
+
+def _to_format_string(chunks: tuple[tuple[str, str | None], ...]) -> str:
+    """
+    Build the str.format string equivalent of a parsed template.
+
+    Args:
+        chunks: Literal text and placeholder pairs from _parse_template
+
+    Returns:
+        str: Format string with escaped literal braces
+    """
+    return "".join(
+        _escape_braces(literal) + (f"{{{name}}}" if name is not None else "")
+        for literal, name in chunks
+    )
+
+
+@lru_cache(maxsize=32)
+def _inputs_adapter(names: frozenset[str]) -> TypeAdapter[Any]:
+    """
+    Return a validator requiring a string value for each of the given inputs.
+
+    Prompts with the same required inputs share one adapter, and inputs that are
+    not required are ignored.
+
+    Args:
+        names: Names of the required inputs
+
+    Returns:
+        TypeAdapter[Any]: Validator for a mapping of input values
+    """
+    fields = dict.fromkeys(sorted(names), StrictStr)
+    return TypeAdapter(TypedDict("RequiredPromptInputs", fields))  # pyright: ignore [reportArgumentType]
+
+
+class _Placeholders(dict[str, object]):
+    """Format mapping that renders placeholders without a value back as ${name}."""
+
+    def __missing__(self, key: str) -> str:
+        return f"${{{key}}}"
+
+
 class PromptInputs(TypedDict, total=False):
     """
     Type definition for various types of prompt inputs.
@@ -94,7 +207,7 @@ class PromptInputs(TypedDict, total=False):
     code: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Prompt:
     """
     A dataclass representing an AI prompt template with its metadata
@@ -137,14 +250,44 @@ class Prompt:
     examples: list[dict[str, str]] | None = None
     category: str | None = None
     version: str = "1.0"
+    _format_string: str = field(init=False, repr=False, compare=False)
+    _required: frozenset[str] = field(init=False, repr=False, compare=False)
+    _covers_all: bool = field(init=False, repr=False, compare=False)
+    _single: tuple[str, str, str] | None = field(init=False, repr=False, compare=False)
+    _adapter: TypeAdapter[Any] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Parse the template and required inputs once, when the prompt is built."""
+        chunks = _parse_template(self.template)
+        required = frozenset(self.required_inputs or ())
+        # When every placeholder is required, the missing-input check guarantees a
+        # value for each one and kwargs can be formatted directly
+        covers_all = {name for _, name in chunks if name} <= required
+        # Most prompts have a single placeholder; splicing the value between the
+        # surrounding text avoids scanning the whole template on every call
+        single = None
+        if covers_all and len(chunks) == 2:  # noqa: PLR2004
+            (prefix, name), (suffix, _) = chunks
+            if name is not None:
+                single = (prefix, name, suffix)
+        # The dataclass is frozen, so derived fields bypass its __setattr__
+        object.__setattr__(self, "_format_string", _to_format_string(chunks))
+        object.__setattr__(self, "_required", required)
+        object.__setattr__(self, "_covers_all", covers_all)
+        object.__setattr__(self, "_single", single)
+        object.__setattr__(
+            self, "_adapter", _inputs_adapter(required) if required else None
+        )
 
     def format(self, **kwargs: str | PromptInputs) -> str:
         """
         Format the prompt template with provided input values.
 
-        This method uses string.Template to substitute variables in the prompt
-        template with provided values. It validates that all required inputs
-        are provided before formatting.
+        This method substitutes string.Template-style variables in the prompt
+        template with provided values, using the str.format_map equivalent of the
+        template built at construction. Placeholders without a value are left in
+        the output as ${name}. It validates that all required inputs
+        are provided, as strings, before formatting.
 
         Args:
             **kwargs: Keyword arguments containing values for template variables.
@@ -155,7 +298,7 @@ class Prompt:
 
         Raises:
             ValueError: If any required inputs are missing from kwargs.
-            KeyError: If template substitution fails due to missing keys.
+            pydantic.ValidationError: If a required input is not a string.
 
         Example:
             ```python
@@ -167,14 +310,22 @@ class Prompt:
             result = prompt.format(name="Alice")
             ```
         """
-        if not self.required_inputs:
+        if not self._required:
             return self.template
 
-        try:
-            return Template(self.template).safe_substitute(**kwargs)
-        except KeyError as e:
-            missing_keys = set(self.required_inputs) - set(kwargs.keys())
-            if missing_keys:
-                msg = f"Missing required inputs: {missing_keys}"
-                raise ValueError(msg) from e
-            raise
+        # Comparing the keys view against the required set allocates nothing; the
+        # missing set is only built to report an error
+        if not kwargs.keys() >= self._required:
+            # difference() looks keys up in kwargs directly; subtracting the keys
+            # view would first copy it into a set
+            missing_keys = self._required.difference(kwargs)
+            msg = f"Missing required inputs: {', '.join(sorted(missing_keys))}"
+            raise ValueError(msg)
+        if self._adapter is not None:
+            self._adapter.validate_python(kwargs)
+        if self._single is not None:
+            prefix, name, suffix = self._single
+            return f"{prefix}{kwargs[name]}{suffix}"
+        if self._covers_all:
+            return self._format_string.format_map(kwargs)
+        return self._format_string.format_map(_Placeholders(kwargs))
@@ -16,14 +16,33 @@ Example:
     ```
 """
 
-from typing import Any
+from collections import OrderedDict
+from functools import cache
+from typing import Any, Final
 
 import structlog
+from structlog.typing import FilteringBoundLogger
 
-from flare_ai_defai.prompts.library import PromptLibrary
+from flare_ai_defai.prompts.library import DEFAULT_LIBRARY, PromptLibrary
+from flare_ai_defai.prompts.schemas import Prompt
 
 logger = structlog.get_logger(__name__)
 
+_FORMATTED_CACHE_SIZE: Final = 1024
+
+
+@cache
+def _service_logger() -> FilteringBoundLogger:
+    """
+    Return the logger shared by every PromptService, bound on first use.
+
+    Binding resolves the structlog configuration, so it is deferred until the
+    first service is created. This module can be imported before settings.py
+    configures the LOG_LEVEL filter, e.g. through the api package, and binding at
+    import would lock in the unfiltered default.
+    """
+    return logger.bind(service="prompt")
+
 
 class PromptService:
     """
@@ -34,7 +53,8 @@ class PromptService:
     class to provide additional functionality and safety checks.
 
     The service maintains its own structured logger instance for detailed
-    operational logging and debugging.
+    operational logging and debugging. Formatted prompts are cached per prompt
+    name and arguments, so repeated requests skip the substitution.
 
     Attributes:
         library (PromptLibrary): Instance of the prompt library containing all
@@ -53,15 +73,24 @@ class PromptService:
         ```
     """
 
-    def __init__(self) -> None:
+    def __init__(self, library: PromptLibrary | None = None) -> None:
         """
         Initialize a new PromptService instance.
 
-        Creates a new PromptLibrary instance and initializes a bound logger
+        Uses the shared default library unless one is given, so creating a
+        service does not rebuild the prompts, and initializes a bound logger
         with the service context.
+
+        Args:
+            library (PromptLibrary | None): Library to serve prompts from; pass
+                one when the prompts will be modified, to keep the shared
+                default library unchanged
         """
-        self.library = PromptLibrary()
-        self.logger = logger.bind(service="prompt")
+        self.library = library if library is not None else DEFAULT_LIBRARY
+        self.logger = _service_logger()
+        self._formatted: OrderedDict[
+            tuple[str, tuple[tuple[str, Any], ...]], tuple[Prompt, str]
+        ] = OrderedDict()
 
     def get_formatted_prompt(
         self, prompt_name: str, **kwargs: Any
@@ -107,7 +136,7 @@ class PromptService:
         """
         try:
             prompt = self.library.get_prompt(prompt_name)
-            formatted = prompt.format(**kwargs)
+            formatted = self._format(prompt, kwargs)
         except Exception as e:
             self.logger.exception(
                 "prompt_formatting_failed", prompt_name=prompt_name, error=str(e)
@@ -115,3 +144,41 @@ class PromptService:
             raise
         else:
             return (formatted, prompt.response_mime_type, prompt.response_schema)
+
+    def _format(self, prompt: Prompt, kwargs: dict[str, Any]) -> str:
+        """
+        Format a prompt, reusing the result of an identical earlier call.
+
+        Prompts without required inputs always format to their template, so they
+        are returned directly without building a cache key. Cached results are
+        only reused while the library still holds the same prompt, so replacing a
+        prompt invalidates them.
+
+        Args:
+            prompt (Prompt): Prompt to format
+            kwargs (dict[str, Any]): Values for the template variables
+
+        Returns:
+            str: The formatted prompt string
+
+        Raises:
+            ValueError: If required format parameters are missing
+        """
+        if not prompt.required_inputs:
+            return prompt.template
+        try:
+            key = (prompt.name, tuple(sorted(kwargs.items())))
+            cached = self._formatted.get(key)
+        except TypeError:
+            # Unhashable values cannot be part of a cache key
+            return prompt.format(**kwargs)
+        if cached is not None and cached[0] is prompt:
+            self._formatted.move_to_end(key)
+            return cached[1]
+
+        formatted = prompt.format(**kwargs)
+        self._formatted[key] = (prompt, formatted)
+        self._formatted.move_to_end(key)
+        if len(self._formatted) > _FORMATTED_CACHE_SIZE:
+            self._formatted.popitem(last=False)
+        return formatted
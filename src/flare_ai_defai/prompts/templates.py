@@ -29,14 +29,60 @@ Categories (in order of precedence):
    • General questions, greetings, or unclear requests
    • Any ambiguous or multi-category inputs
 
-Input: ${user_input}
-
 Instructions:
 - Choose ONE category only
 - Select most specific matching category
 - Default to CONVERSATIONAL if unclear
 - Ignore politeness phrases or extra context
 - Focus on core intent of request
+
+Input: ${user_input}
+"""
+
+COMBINED_ROUTER_AND_ACTION: Final = """
+Classify the following user input into EXACTLY ONE route and extract the parameters that route needs.
+
+Routes (in order of precedence):
+1. GenerateAccount
+   • Keywords: create wallet, new account, generate address, make wallet
+   • Must express intent to create/generate new account/wallet
+   • Ignore if just asking about existing accounts
+
+2. SendToken
+   • Keywords: send, transfer, pay, give tokens
+   • Must include intent to transfer tokens to another address
+   • Should involve one-way token movement
+
+3. SwapToken
+   • Keywords: swap, exchange, trade, convert tokens
+   • Must involve exchanging one token type for another
+   • Should mention both source and target tokens
+
+4. RequestAttestation
+   • Keywords: attestation, verify, prove, check enclave
+   • Must specifically request verification or attestation
+   • Related to security or trust verification
+
+5. Conversational (default)
+   • Use when input doesn't clearly match above categories
+   • General questions, greetings, or unclear requests
+   • Any ambiguous or multi-category inputs
+
+Payload rules:
+- For SendToken, fill the payload with:
+  • to_address: must start with "0x", be exactly 42 characters long and contain hexadecimal characters only; extract the COMPLETE address, DO NOT modify or truncate
+  • amount: positive float; convert written numbers to digits (e.g., "five" → 5.0) and integers to float (e.g., 100 → 100.0)
+  • Omit any field that is missing or invalid, DO NOT infer missing values
+- For every other route, return an empty payload
+
+Instructions:
+- Choose ONE route only
+- Select most specific matching route
+- Default to Conversational if unclear
+- Ignore politeness phrases or extra context
+- Focus on core intent of request
+
+Input: ${user_input}
 """
 
 GENERATE_ACCOUNT: Final = """
@@ -48,7 +94,7 @@ Generate a welcoming message that includes ALL of these elements in order:
    - Private keys never leave the secure enclave
    - Hardware-level protection against tampering
 3. Account address display:
-   - EXACTLY as provided, make no changes: ${address}
+   - Use the account address given at the end EXACTLY as provided, make no changes
    - Format with clear visual separation
 4. Funding account instructions:
    - Tell the user to fund the new account: [Add funds to account](https://faucet.flare.network/coston2)
@@ -66,6 +112,8 @@ keeping your private keys safe and secure, you freely share your
 public address: 0x123...
 [Add funds to account](https://faucet.flare.network/coston2)
 Ready to start exploring the Flare network?"
+
+Account address: ${address}
 """
 
 TOKEN_SEND: Final = """
@@ -92,8 +140,6 @@ Extract EXACTLY two pieces of information from the input text for a token send o
    • Extract first valid number only
    • FAIL if no valid amount found
 
-Input: ${user_input}
-
 Rules:
 - Both fields MUST be present
 - Amount MUST be positive
@@ -101,6 +147,18 @@ Rules:
 - DO NOT infer missing values
 - DO NOT modify the address
 - FAIL if either value is missing or invalid
+
+Input: ${user_input}
+"""
+
+FOLLOW_UP_TOKEN_SEND: Final = """
+The user wants to send tokens, but the request is missing a valid destination address or amount.
+
+Ask the user to provide the missing details:
+- Destination address: must start with "0x" and be exactly 42 characters long
+- Amount: a positive number of FLR to send
+
+Keep the response concise (max 2 sentences) and include an example request such as "Send 10 FLR to 0x...".
 """
 
 TOKEN_SWAP: Final = """
@@ -134,8 +192,6 @@ Extract EXACTLY three pieces of information from the input for a token swap oper
    • Amount MUST be positive
    • FAIL if no valid amount found
 
-Input: ${user_input}
-
 Response format:
 {
   "from_token": "<UPPERCASE_TOKEN_SYMBOL>",
@@ -157,6 +213,8 @@ Examples:
 ✓ "exchange 50.5 flr for usdc" → {"from_token": "FLR", "to_token": "USDC", "amount": 50.5}
 ✗ "swap flr to flr" → FAIL (same token)
 ✗ "swap tokens" → FAIL (missing amount)
+
+Input: ${user_input}
 """
 
 CONVERSATIONAL: Final = """
@@ -205,8 +263,7 @@ Respond with a confirmation message for the successful transaction that:
 
 1. Required elements:
    - Express positive acknowledgement of the successful transaction
-   - Include the EXACT transaction hash link with NO modifications:
-     [See transaction on Explorer](${block_explorer}/tx/${tx_hash})
+   - Include the EXACT transaction link given at the end with NO modifications
    - Place the link on its own line for visibility
 
 2. Message structure:
@@ -215,7 +272,7 @@ Respond with a confirmation message for the successful transaction that:
    - End with a brief positive closing statement
 
 3. Link requirements:
-   - Preserve all variables: ${block_explorer} and ${tx_hash}
+   - Preserve the link URL exactly as given
    - Maintain exact markdown link syntax
    - Keep URL structure intact
    - No additional formatting or modification of the link
@@ -223,7 +280,9 @@ Respond with a confirmation message for the successful transaction that:
 Sample format:
 Great news! Your transaction has been successfully confirmed. 🎉
 
-[See transaction on Explorer](${block_explorer}/tx/${tx_hash})
+[See transaction on Explorer](<transaction link>)
 
 Your transaction is now securely recorded on the blockchain.
+
+Transaction link: [See transaction on Explorer](${block_explorer}/tx/${tx_hash})
 """
@@ -9,12 +9,31 @@ The settings can be overridden by environment variables or through a .env file.
 Environment variables take precedence over values defined in the .env file.
 """
 
+from functools import lru_cache
+from typing import Annotated, Any
+
+import orjson
 import structlog
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import BeforeValidator, Field
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 logger = structlog.get_logger(__name__)
 
 
+def _split_origins(value: Any) -> Any:
+    """
+    Parse CORS origins given as a comma-separated string.
+
+    A value starting with "[" is still decoded as a JSON list, so existing
+    configurations keep working.
+    """
+    if not isinstance(value, str):
+        return value
+    if value.lstrip().startswith("["):
+        return orjson.loads(value)
+    return [origin.strip() for origin in value.split(",") if origin.strip()]
+
+
 class Settings(BaseSettings):
     """
     Application settings model that provides configuration for all components.
@@ -22,8 +41,13 @@ class Settings(BaseSettings):
 
     # Flag to enable/disable attestation simulation
     simulate_attestation: bool = False
-    # Restrict backend listener to specific IPs
-    cors_origins: list[str] = ["*"]
+    # Maximum nonces merged into one attestation request (at most 6); 0 disables
+    # batching of concurrent requests
+    attestation_batch_size: int = Field(default=0, ge=0, le=6)
+    # Restrict backend listener to specific IPs, comma-separated
+    cors_origins: Annotated[list[str], NoDecode, BeforeValidator(_split_origins)] = [
+        "*"
+    ]
     # API key for accessing Google's Gemini AI service
     gemini_api_key: str = ""
     # The Gemini model identifier to use
@@ -34,6 +58,8 @@ class Settings(BaseSettings):
     web3_provider_url: str = "https://coston2-api.flare.network/ext/C/rpc"
     # URL for the Flare Network block explorer
     web3_explorer_url: str = "https://coston2-explorer.flare.network/"
+    # Minimum log level; events below it are dropped before any processing
+    log_level: str = "info"
 
     model_config = SettingsConfigDict(
         # This enables .env file support
@@ -45,6 +71,20 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings from the environment once, on first use."""
+    return Settings()
+
+
 # Create a global settings instance
-settings = Settings()
-logger.debug("settings", settings=settings.model_dump())
+settings = get_settings()
+# Configure logging as soon as the level is known. Filtering happens in the
+# logger class itself, so disabled log calls return immediately without
+# building an event dict
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(settings.log_level)
+)
+# Only serialize the settings when debug logging is configured
+if settings.log_level.lower() == "debug":
+    logger.debug("settings", settings=settings.model_dump())
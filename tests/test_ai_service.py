@@ -1,7 +1,86 @@
-from flare_ai_defai.ai import GeminiProvider
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from flare_ai_defai.ai import GeminiProvider, LLMCache, ModelResponse
 
 
 async def test_generate() -> None:
     service = GeminiProvider("test_key", "gemini-1.5-flash")
-    response = service.generate("Test prompt")
+    response = await service.generate("Test prompt")
     assert response is not None
+
+
+def test_llm_cache_evicts_least_recently_used() -> None:
+    cache = LLMCache(maxsize=2)
+    response = ModelResponse(text="SendToken", raw_response=None, metadata={})
+
+    async def run() -> None:
+        await cache.set("a", response)
+        await cache.set("b", response)
+        assert await cache.get("a") is response
+        await cache.set("c", response)
+        assert await cache.get("b") is None
+        assert await cache.get("a") is response
+
+    asyncio.run(run())
+
+
+def test_llm_cache_expires_entries() -> None:
+    cache = LLMCache(ttl=-1.0)
+    response = ModelResponse(text="SendToken", raw_response=None, metadata={})
+
+    async def run() -> None:
+        await cache.set("a", response)
+        assert await cache.get("a") is None
+
+    asyncio.run(run())
+
+
+async def fake_stream(*_: object, **__: object) -> AsyncIterator[Any]:
+    async def chunks() -> AsyncIterator[Any]:
+        for text in ("Hel", "lo"):
+            await asyncio.sleep(0)
+            yield SimpleNamespace(text=text)
+
+    return chunks()
+
+
+def test_aborted_stream_leaves_chat_history_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = GeminiProvider("test_key", "gemini-1.5-flash")
+
+    monkeypatch.setattr(service.model, "generate_content_async", fake_stream)
+
+    async def run() -> None:
+        aborted = service.stream("first")
+        assert await anext(aborted) == "Hel"
+        await aborted.aclose()
+        assert service.chat is not None
+        assert len(service.chat.history) == 1
+
+        assert [chunk async for chunk in service.stream("second")] == ["Hel", "lo"]
+        assert len(service.chat.history) == 3  # noqa: PLR2004
+
+    asyncio.run(run())
+
+
+def test_concurrent_streams_each_extend_chat_history(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = GeminiProvider("test_key", "gemini-1.5-flash")
+    monkeypatch.setattr(service.model, "generate_content_async", fake_stream)
+
+    async def consume(msg: str) -> list[str]:
+        return [chunk async for chunk in service.stream(msg)]
+
+    async def run() -> None:
+        await asyncio.gather(consume("first"), consume("second"))
+
+    asyncio.run(run())
+    assert service.chat is not None
+    assert len(service.chat.history) == 5  # noqa: PLR2004
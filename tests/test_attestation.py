@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from flare_ai_defai.attestation import AsyncBatchingVtpm, Vtpm, VtpmAttestationError
+
+
+@pytest.fixture
+def sent_nonces(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Replace the attestation service call and record the nonces of each request."""
+    sent: list[list[str]] = []
+
+    async def request_token(
+        _: Vtpm, nonces: list[str], audience: str, token_type: str
+    ) -> str:
+        sent.append(nonces)
+        return f"token-{len(sent)}"
+
+    # Batches are sent through the base client's service call
+    monkeypatch.setattr(Vtpm, "_request_token", request_token)
+    return sent
+
+
+def test_batching_merges_concurrent_requests(sent_nonces: list[list[str]]) -> None:
+    vtpm = AsyncBatchingVtpm(max_batch_nonces=3, batch_wait_timeout_s=0.05)
+
+    async def run() -> list[str]:
+        nonces = [f"nonce-{i:05d}" for i in range(4)]
+        tokens = await asyncio.gather(*(vtpm.get_token([n]) for n in nonces))
+        await vtpm.aclose()
+        return tokens
+
+    tokens = asyncio.run(run())
+    assert sent_nonces == [
+        ["nonce-00000", "nonce-00001", "nonce-00002"],
+        ["nonce-00003"],
+    ]
+    assert tokens == ["token-1", "token-1", "token-1", "token-2"]
+
+
+def test_token_cache_reuses_identical_requests(sent_nonces: list[list[str]]) -> None:
+    vtpm = Vtpm(cache_ttl_s=30)
+
+    async def run() -> list[str]:
+        tokens = [
+            await vtpm.get_token(["health-check"]),
+            await vtpm.get_token(["health-check"]),
+            await vtpm.get_token(["other-nonce"]),
+        ]
+        await vtpm.aclose()
+        return tokens
+
+    assert asyncio.run(run()) == ["token-1", "token-1", "token-2"]
+    assert sent_nonces == [["health-check"], ["other-nonce"]]
+
+
+def test_reused_nonce_is_rejected_locally(sent_nonces: list[list[str]]) -> None:
+    vtpm = Vtpm()
+
+    async def run() -> None:
+        assert await vtpm.get_token(["nonce-00000"]) == "token-1"
+        with pytest.raises(VtpmAttestationError):
+            await vtpm.get_token(["nonce-00001", "nonce-00000"])
+        await vtpm.aclose()
+
+    asyncio.run(run())
+    assert sent_nonces == [["nonce-00000"]]
+
+
+def test_failed_request_does_not_use_up_nonce(
+    sent_nonces: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    record_request = Vtpm._request_token  # noqa: SLF001
+    calls = 0
+
+    async def fail_first_request(
+        vtpm: Vtpm, nonces: list[str], audience: str, token_type: str
+    ) -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            msg = "Failed to reach attestation service"
+            raise VtpmAttestationError(msg)
+        return await record_request(vtpm, nonces, audience, token_type)  # pyright: ignore [reportArgumentType]
+
+    monkeypatch.setattr(Vtpm, "_request_token", fail_first_request)
+    vtpm = Vtpm()
+
+    async def run() -> str:
+        with pytest.raises(VtpmAttestationError, match="Failed to reach"):
+            await vtpm.get_token(["nonce-00000"])
+        token = await vtpm.get_token(["nonce-00000"])
+        await vtpm.aclose()
+        return token
+
+    assert asyncio.run(run()) == "token-1"
+    assert sent_nonces == [["nonce-00000"]]
@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+from web3.exceptions import Web3RPCError
+from web3.types import TxParams
+
+from flare_ai_defai.ai import GeminiProvider, ModelResponse
+from flare_ai_defai.api.routes.chat import (
+    ChatRouter,
+    _format_flr,
+    _normalize_query,
+    _parse_route,
+)
+from flare_ai_defai.attestation import Vtpm
+from flare_ai_defai.blockchain import FlareProvider
+from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
+from flare_ai_defai.prompts.schemas import TokenSendResponse
+
+RECIPIENT = "0x000000000000000000000000000000000000dEaD"
+
+
+@pytest.fixture
+def chat_router() -> ChatRouter:
+    return ChatRouter(
+        ai=GeminiProvider("test_key", "gemini-1.5-flash"),
+        blockchain=FlareProvider("http://localhost:8545"),
+        attestation=Vtpm(simulate=True),
+        prompts=PromptService(),
+    )
+
+
+def reply_with(
+    monkeypatch: pytest.MonkeyPatch, chat_router: ChatRouter, *replies: str
+) -> list[str]:
+    """Answer the router's AI calls with the given texts and record the prompts."""
+    prompts: list[str] = []
+    pending = list(replies)
+
+    async def generate(prompt: str, **_: object) -> ModelResponse:
+        prompts.append(prompt)
+        return ModelResponse(text=pending.pop(0), raw_response=None, metadata={})
+
+    monkeypatch.setattr(chat_router.ai, "generate", generate)
+    return prompts
+
+
+def test_reset_command_runs_while_attestation_pending(
+    chat_router: ChatRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    nonces: list[list[str]] = []
+
+    async def get_token(vtpm_nonces: list[str], *_: object) -> str:
+        nonces.append(vtpm_nonces)
+        return "token"
+
+    monkeypatch.setattr(chat_router.attestation, "get_token", get_token)
+    chat_router.blockchain.generate_account()
+    chat_router.attestation.attestation_requested = True
+
+    response = asyncio.run(chat_router.handle_direct_message("/reset"))
+
+    assert response == {"response": "Reset complete"}
+    assert chat_router.blockchain.address is None
+    assert nonces == []
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "hello world",
+        "Hello  World ?",
+        "hello world?",
+        " HELLO\tworld !. ",
+        "hello world ?",
+    ],
+)
+def test_normalize_query_ignores_case_spacing_and_punctuation(message: str) -> None:
+    assert _normalize_query(message) == "hello world"
+
+
+def test_resolve_route_reuses_cached_combined_route(
+    chat_router: ChatRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompts = reply_with(
+        monkeypatch, chat_router, '{"route": "Conversational", "payload": {}}'
+    )
+
+    async def run() -> list[object]:
+        return [
+            await chat_router.resolve_route("How are you?"),
+            await chat_router.resolve_route("how are  you"),
+        ]
+
+    expected = (SemanticRouterResponse.CONVERSATIONAL, {})
+    assert asyncio.run(run()) == [expected, expected]
+    assert len(prompts) == 1
+
+
+def test_invalid_combined_route_falls_back_to_semantic_router(
+    chat_router: ChatRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompts = reply_with(
+        monkeypatch,
+        chat_router,
+        '{"route": "SendToken", "payload": {"amount": "a lot"}}',
+        "SendToken",
+    )
+
+    route = asyncio.run(chat_router.resolve_route("Send some FLR"))
+
+    assert route == (SemanticRouterResponse.SEND_TOKEN, None)
+    assert len(prompts) == 2  # noqa: PLR2004
+
+
+def test_combined_route_payload_skips_parameter_extraction(
+    chat_router: ChatRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompts = reply_with(
+        monkeypatch,
+        chat_router,
+        f'{{"route": "SendToken", "payload": {{"to_address": "{RECIPIENT}", '
+        '"amount": 1.5}}',
+    )
+
+    async def create_send_flr_tx(to_address: str, amount: float) -> TxParams:
+        return {"to": to_address, "value": int(amount * 10**18)}
+
+    monkeypatch.setattr(
+        chat_router.blockchain, "create_send_flr_tx", create_send_flr_tx
+    )
+    chat_router.blockchain.generate_account()
+
+    async def run() -> dict[str, str]:
+        route, payload = await chat_router.resolve_route("Send 1.5 FLR")
+        return await chat_router.route_message(route, "Send 1.5 FLR", payload)
+
+    assert asyncio.run(run()) == {
+        "response": f"Transaction Preview: Sending 1.5 FLR to {RECIPIENT}\n"
+        "Type CONFIRM to proceed."
+    }
+    assert len(prompts) == 1
+
+
+@pytest.mark.parametrize(
+    ("value_wei", "expected"),
+    [
+        (0, "0"),
+        (10**18, "1"),
+        (1, "0.000000000000000001"),
+        (1_500_000_000_000_000_000, "1.5"),
+        (123_456_789 * 10**18 + 10**17, "123456789.1"),
+        (
+            2**256 - 1,
+            "115792089237316195423570985008687907853269984665640564039457.584007913129639935",
+        ),
+    ],
+)
+def test_format_flr(value_wei: int, expected: str) -> None:
+    assert _format_flr(value_wei) == expected
+
+
+@pytest.mark.parametrize("value", ["SendToken", "sendtoken", " SENDTOKEN\n"])
+def test_parse_route_ignores_case_and_whitespace(value: str) -> None:
+    assert _parse_route(value) is SemanticRouterResponse.SEND_TOKEN
+
+
+def test_parse_route_rejects_unknown_route() -> None:
+    with pytest.raises(ValueError, match="not a valid SemanticRouterResponse"):
+        _parse_route("BurnToken")
+
+
+def test_unknown_semantic_route_falls_back_to_conversational(
+    chat_router: ChatRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reply_with(monkeypatch, chat_router, "BurnToken")
+
+    route = asyncio.run(chat_router.get_semantic_route("Burn my tokens"))
+
+    assert route is SemanticRouterResponse.CONVERSATIONAL
+
+
+def test_failed_node_lookup_during_first_send_is_reported(
+    chat_router: ChatRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def generate(
+        prompt: str, response_schema: object = None, **_: object
+    ) -> ModelResponse:
+        # Parameter extraction runs concurrently with account generation
+        if response_schema is TokenSendResponse:
+            text = f'{{"to_address": "{RECIPIENT}", "amount": 1.5}}'
+        else:
+            text = f"Welcome! {prompt}"
+        return ModelResponse(text=text, raw_response=None, metadata={})
+
+    async def create_send_flr_tx(to_address: str, amount: float) -> TxParams:
+        msg = "nonce too low"
+        raise Web3RPCError(msg)
+
+    monkeypatch.setattr(chat_router.ai, "generate", generate)
+    monkeypatch.setattr(
+        chat_router.blockchain, "create_send_flr_tx", create_send_flr_tx
+    )
+
+    response = asyncio.run(chat_router.handle_send_token("Send 1.5 FLR"))
+
+    assert response["response"].startswith("Welcome!")
+    assert response["response"].endswith(
+        "Unfortunately the tx could not be created:\nnonce too low"
+    )
+    assert chat_router.blockchain.address is not None
+    assert not chat_router.blockchain.tx_queue
@@ -1,6 +1,8 @@
 import pytest
+from pydantic import ValidationError
 
-from flare_ai_defai.prompts import PromptLibrary
+from flare_ai_defai.prompts import PromptLibrary, PromptService
+from flare_ai_defai.prompts.schemas import Prompt
 
 
 def test_prompt_library_initialization() -> None:
@@ -21,3 +23,47 @@ def test_prompt_missing_inputs() -> None:
     prompt = library.get_prompt("generate_account")
     with pytest.raises(ValueError, match="Missing required inputs: address"):
         prompt.format(wrong_input="test")
+
+
+def test_prompt_rejects_non_string_inputs() -> None:
+    library = PromptLibrary()
+    prompt = library.get_prompt("generate_account")
+    with pytest.raises(ValidationError):
+        prompt.format(address=123)  # pyright: ignore [reportArgumentType]
+
+
+def test_prompts_by_category_after_replacing_prompt() -> None:
+    library = PromptLibrary()
+    replacement = Prompt(
+        name="generate_account",
+        description="Moved to a new category",
+        template="Account: ${address}",
+        required_inputs=["address"],
+        response_schema=None,
+        response_mime_type=None,
+        category="misc",
+    )
+    library.add_prompt(replacement)
+    account_prompts = library.get_prompts_by_category("account")
+    assert "generate_account" not in [prompt.name for prompt in account_prompts]
+    assert library.get_prompts_by_category("misc") == [replacement]
+    assert "misc" in library.list_categories()
+
+
+def test_formatted_prompt_cache_follows_replaced_prompt() -> None:
+    service = PromptService(library=PromptLibrary())
+    first, _, _ = service.get_formatted_prompt("generate_account", address="0x123")
+    again, _, _ = service.get_formatted_prompt("generate_account", address="0x123")
+    assert again == first
+    service.library.add_prompt(
+        Prompt(
+            name="generate_account",
+            description="Shorter account prompt",
+            template="Account: ${address}",
+            required_inputs=["address"],
+            response_schema=None,
+            response_mime_type=None,
+        )
+    )
+    formatted, _, _ = service.get_formatted_prompt("generate_account", address="0x123")
+    assert formatted == "Account: 0x123"
@@ -0,0 +1,21 @@
+import pytest
+from pydantic import ValidationError
+
+from flare_ai_defai.settings import Settings
+
+
+@pytest.mark.parametrize("batch_size", [-1, 7])
+def test_attestation_batch_size_out_of_range(
+    monkeypatch: pytest.MonkeyPatch, batch_size: int
+) -> None:
+    monkeypatch.setenv("ATTESTATION_BATCH_SIZE", str(batch_size))
+    with pytest.raises(ValidationError, match="attestation_batch_size"):
+        Settings()
+
+
+@pytest.mark.parametrize("batch_size", [0, 6])
+def test_attestation_batch_size_in_range(
+    monkeypatch: pytest.MonkeyPatch, batch_size: int
+) -> None:
+    monkeypatch.setenv("ATTESTATION_BATCH_SIZE", str(batch_size))
+    assert Settings().attestation_batch_size == batch_size